@@ -1,51 +1,23 @@
-"""
-Canary Test Module
+"""Canary Test Module: E2E customer-journey monitoring for Maxeo (see README.md)."""
 
-E2E monitoring system that simulates a real customer journey:
-Landing page → Get Report → OTP → Workspace setup → Prompts → Snapshot → Dashboard
+import importlib
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-Usage:
-    # Async usage
-    from canary import run_canary_test
-    result = await run_canary_test()
-
-    # Sync usage (for cron/CLI)
-    from canary import run_canary_test_sync
-    result = run_canary_test_sync()
-
-    # CLI execution
-    python -m app.modules.canary.canary_test
-"""
-
-from canary.canary_test import (
-    CanaryTest,
-    run_canary_test,
-    run_canary_test_sync,
-)
-from canary.alerting import (
-    CanaryResult,
-    CanaryMetrics,
-    CanaryTestError,
-    AlertManager,
-)
-from canary.config import (
-    CanaryConfig,
-    get_canary_config,
-)
-from canary.db_verification import (
-    DBVerifier,
-    VerificationResult,
-)
-from canary.browser_automation import BrowserAutomation
+if TYPE_CHECKING:
+    from canary.browser_automation import BrowserAutomation  # noqa: F401
 
 # Note: CanaryCleanup is not imported by default as it depends on SQLModel ORM
 # Import it directly if needed: from canary.cleanup import CanaryCleanup
+# BrowserAutomation is only resolved on access so that Playwright is not
+# imported by consumers that only need config, alerting or DB verification.
 
-__all__ = [
+__all__ = (
     # Main test functions
     "CanaryTest",
     "run_canary_test",
     "run_canary_test_sync",
+    "run_on_fast_loop",
     # Result types
     "CanaryResult",
     "CanaryMetrics",
@@ -58,4 +30,53 @@ __all__ = [
     # Config
     "CanaryConfig",
     "get_canary_config",
-]
+    "invalidate_config_cache",
+)
+
+_ALL = frozenset(__all__)
+
+# Public name -> (module, attribute), resolved on first access
+_LAZY = MappingProxyType({
+    "CanaryTest": ("canary.canary_test", "CanaryTest"),
+    "run_canary_test": ("canary.canary_test", "run_canary_test"),
+    "run_canary_test_sync": ("canary.canary_test", "run_canary_test_sync"),
+    "run_on_fast_loop": ("canary.utils", "run_on_fast_loop"),
+    "CanaryResult": ("canary.alerting", "CanaryResult"),
+    "CanaryMetrics": ("canary.alerting", "CanaryMetrics"),
+    "CanaryTestError": ("canary.alerting", "CanaryTestError"),
+    "AlertManager": ("canary.alerting", "AlertManager"),
+    "DBVerifier": ("canary.db_verification", "DBVerifier"),
+    "VerificationResult": ("canary.db_verification", "VerificationResult"),
+    "BrowserAutomation": ("canary.browser_automation", "BrowserAutomation"),
+    "CanaryConfig": ("canary.config", "CanaryConfig"),
+    "get_canary_config": ("canary.config", "get_canary_config"),
+    "invalidate_config_cache": ("canary.config", "invalidate_config_cache"),
+})
+
+# Submodules already imported through __getattr__
+_MOD_CACHE: dict = {}
+
+
+def __getattr__(name):
+    """Resolve public names lazily on first access (PEP 562)."""
+    if name not in _ALL:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = _LAZY[name]
+    module = _MOD_CACHE.get(module_name)
+    if module is None:
+        module = _MOD_CACHE[module_name] = importlib.import_module(module_name)
+
+        # Bind every public name from this submodule at once so sibling
+        # lookups never come back through __getattr__
+        namespace = globals()
+        for public_name, (owner, owner_attr) in _LAZY.items():
+            if owner == module_name:
+                namespace[public_name] = getattr(module, owner_attr)
+
+    return getattr(module, attr)
+
+
+def __dir__():
+    """Include lazily-loaded names so tab-completion and help() still work."""
+    return sorted(set(globals()) | set(_LAZY))
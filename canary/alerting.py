@@ -4,25 +4,219 @@ Alerting Module for Canary Tests
 Handles alerting to Sentry and Slack with detailed metrics reporting.
 """
 
+import asyncio
+import heapq
 import json
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from typing import Optional, Dict, Any, Callable, Iterator, List, NamedTuple, Set, Tuple
 import httpx
 import sentry_sdk
 
 from canary.utils import get_canary_logger
 from canary.config import get_canary_config
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a payload to UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        """Serialize a payload to UTF-8 JSON bytes."""
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 logger = get_canary_logger("canary.alerting")
 
+# Shared read-only default for missing nested dicts (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Slack allows at most 50 blocks per message
+_SLACK_MAX_BLOCKS = 48
+
+# Turkey is UTC+3 year-round (no DST)
+TURKEY_TZ = timezone(timedelta(hours=3))
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+# Baseline timings (expected durations in seconds)
+BASELINE_TIMINGS = {
+    "step_01_landing": 3.0,
+    "step_02_click_get_report": 3.0,
+    "step_03_fill_email": 45.0,
+    "step_04_verify_user": 3.0,
+    "step_05_fill_otp": 70.0,
+    "step_06_workspace_details": 5.0,
+    "step_07_wait_categories": 60.0,
+    "step_08_approve_prompts": 90.0,
+    "step_09_wait_snapshot": 300.0,
+    "step_10_verify_dashboard": 5.0,
+    "step_11_full_verification": 2.0,
+}
+
+# Inverse baselines so comparisons are a multiply instead of a divide
+_BASELINE_INV = {k: 1.0 / v for k, v in BASELINE_TIMINGS.items() if v}
+
+# Display names for the step timings section
+_STEP_NAMES_TR = {
+    "setup": "Setup",
+    "step_01_landing": "1. Landing Page",
+    "step_02_click_get_report": "2. Get Report Click",
+    "step_03_fill_email": "3. Form Doldurma",
+    "step_04_verify_user": "4. User Doğrulama",
+    "step_05_fill_otp": "5. OTP İşlemi",
+    "step_06_workspace_details": "6. Workspace Oluşturma",
+    "step_07_wait_categories": "7. Categories Bekleme",
+    "step_08_approve_prompts": "8. Prompts Onaylama",
+    "step_09_wait_snapshot": "9. Snapshot Bekleme",
+    "step_10_verify_dashboard": "10. Dashboard Doğrulama",
+    "step_11_full_verification": "11. Final Doğrulama",
+}
+
+# Short display names for the slowest steps section
+_SLOW_STEP_NAMES_TR = {
+    "step_03_fill_email": "Form Doldurma",
+    "step_05_fill_otp": "OTP İşlemi",
+    "step_07_wait_categories": "Categories",
+    "step_08_approve_prompts": "Prompts",
+    "step_09_wait_snapshot": "Snapshot",
+}
+
+
+def _iter_baseline_ratios(timings: Dict[str, float]) -> Iterator[Tuple[str, float, Optional[float]]]:
+    """Yield (step, duration, duration/baseline) in one pass; ratio is None without a baseline."""
+    inv_get = _BASELINE_INV.get
+    for step, duration in timings.items():
+        inv = inv_get(step)
+        yield step, duration, (duration * inv if inv else None)
+
+
+class _NormDB(NamedTuple):
+    """DB state normalized from either comprehensive db_data or db_state results.
+
+    Fields are None when the source did not check them.
+    """
+    ws_status: Optional[str]
+    prompt_count: Optional[int]
+    snapshot_found: Optional[bool]
+    snapshot_status: Optional[str]
+    snapshot_failed: int
+    competitors_count: Optional[int]
+    valid: bool
+
+
+_NORM_INVALID = _NormDB(None, None, None, None, 0, None, False)
+
+
+def _normalize_db(result: "CanaryResult") -> _NormDB:
+    """Normalize DB state once: db_data first, db_state results as fallback."""
+    db_data = result.metrics.db_data
+    if db_data and not db_data.get("error"):
+        snap = db_data.get("snapshot")
+        return _NormDB(
+            ws_status=db_data.get("workspace", {}).get("status", "UNKNOWN"),
+            prompt_count=db_data.get("prompts_count", 0),
+            snapshot_found=bool(snap),
+            snapshot_status=snap.get("status") if snap else None,
+            snapshot_failed=(db_data.get("snapshot_prompts_status") or {}).get("failed", 0),
+            competitors_count=db_data.get("competitors_count", 0),
+            valid=True
+        )
+
+    if result.db_state and "results" in result.db_state:
+        results = result.db_state["results"]
+
+        ws_status = None
+        if (ws := results.get("workspace_status")):
+            ws_status = "COMPLETED" if ws.get("success") else (ws.get("data") or {}).get("actual_status", "?")
+
+        snapshot_found = None
+        if (snap := results.get("snapshot")):
+            snapshot_found = bool(snap.get("success"))
+
+        # The db_state fallback only reports a failed prompts check (count
+        # below the minimum) and none of the snapshot-status, snapshot-prompt
+        # or competitor rules, so those stay unset here
+        prompt_count = None
+        if (prompts := results.get("prompts")) and not prompts.get("success"):
+            prompt_count = (prompts.get("data") or {}).get("prompts_count", 0)
+        return _NormDB(
+            ws_status=ws_status,
+            prompt_count=prompt_count,
+            snapshot_found=snapshot_found,
+            snapshot_status=None,
+            snapshot_failed=0,
+            competitors_count=None,
+            valid=True
+        )
+
+    return _NORM_INVALID
+
+
+def _snapshot_anomaly(db: _NormDB) -> Optional[str]:
+    if db.snapshot_found is False:
+        return "🚨 Snapshot oluşmamış!"
+    if db.snapshot_found and db.snapshot_status is not None and db.snapshot_status != "COMPLETED":
+        return f"🚨 Snapshot status: `{db.snapshot_status}` - COMPLETED olmalı!"
+    return None
+
+
+# Anomaly/warning rules as (name, check) pairs over the normalized DB state;
+# a check returns a message or None. Applied in report order.
+_DBRule = Tuple[str, Callable[[_NormDB], Optional[str]]]
+
+_ANOMALY_RULES: Tuple[_DBRule, ...] = (
+    ("ws_status", lambda db: f"🚨 Workspace status `{db.ws_status}` - COMPLETED olmalı!"
+        if db.ws_status is not None and db.ws_status != "COMPLETED" else None),
+    ("prompts", lambda db: f"🚨 Prompts: `{db.prompt_count}` - minimum 15 olmalı!"
+        if db.prompt_count is not None and db.prompt_count < 15 else None),
+    ("snapshot", _snapshot_anomaly),
+    ("snapshot_prompts", lambda db: f"🚨 {db.snapshot_failed} snapshot prompt başarısız!"
+        if db.snapshot_failed > 0 else None),
+)
+
+_WARNING_RULES: Tuple[_DBRule, ...] = (
+    ("prompts_low", lambda db: f"⚠️ Prompts düşük: `{db.prompt_count}`"
+        if db.prompt_count is not None and 15 <= db.prompt_count < 20 else None),
+    ("competitors", lambda db: "⚠️ Competitor bulunamadı" if db.competitors_count == 0 else None),
+)
+
+
+def _iso(ts: float) -> str:
+    """Format an epoch timestamp as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+def _section(text: str) -> Dict[str, Any]:
+    """Build a Slack mrkdwn section block."""
+    return {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+
 
-@dataclass
+def _fields(*texts: str) -> Dict[str, Any]:
+    """Build a Slack section block with mrkdwn fields."""
+    return {"type": "section", "fields": [{"type": "mrkdwn", "text": t} for t in texts]}
+
+
+# Static Slack blocks, shared across messages (never mutated)
+_DIVIDER = {"type": "divider"}
+_LOADING_HEADER = _section("*🚀 KRİTİK YÜKLENİYOR SÜRELERİ*")
+_STEP_TIMINGS_HEADER = _section("*📈 ADIM SÜRELERİ*")
+_DB_HEADER = _section("*📦 VERİ DURUMU (DB)*")
+_AI_HEADER = _section("*🤖 AI MODEL SÜRELERİ*")
+_UI_HEADER = _section("*🖥️ UI DOĞRULAMA*")
+
+
+@dataclass(slots=True, kw_only=True)
 class CanaryMetrics:
     """Metrics collected during canary test execution."""
     test_id: str = ""
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    # Epoch nanoseconds (time.time_ns()); see start_time/end_time for datetimes
+    start_time_ns: Optional[int] = None
+    end_time_ns: Optional[int] = None
     step_timings: Dict[str, float] = field(default_factory=dict)
     errors: List[Dict[str, Any]] = field(default_factory=list)
 
@@ -32,12 +226,26 @@ class CanaryMetrics:
     # UI verification results
     ui_data: Dict[str, Any] = field(default_factory=dict)
 
+    @property
+    def start_time(self) -> Optional[datetime]:
+        """Test start as a UTC datetime."""
+        if self.start_time_ns is None:
+            return None
+        return datetime.fromtimestamp(self.start_time_ns / 1e9, timezone.utc)
+
+    @property
+    def end_time(self) -> Optional[datetime]:
+        """Test end as a UTC datetime."""
+        if self.end_time_ns is None:
+            return None
+        return datetime.fromtimestamp(self.end_time_ns / 1e9, timezone.utc)
+
     @property
     def total_duration_seconds(self) -> float:
         """Get total test duration in seconds."""
-        if not self.start_time or not self.end_time:
+        if self.start_time_ns is None or self.end_time_ns is None:
             return 0.0
-        return (self.end_time - self.start_time).total_seconds()
+        return (self.end_time_ns - self.start_time_ns) / 1e9
 
     def record_step_timing(self, step_name: str, duration_seconds: float) -> None:
         """Record timing for a specific step."""
@@ -49,7 +257,7 @@ class CanaryMetrics:
             "step": step,
             "error": error,
             "details": details,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": time.time()  # epoch seconds; formatted with _iso() on output
         })
 
     def set_db_data(self, data: Dict[str, Any]) -> None:
@@ -61,7 +269,7 @@ class CanaryMetrics:
         self.ui_data = data
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class CanaryResult:
     """Result of a canary test execution."""
     success: bool
@@ -74,6 +282,19 @@ class CanaryResult:
     workspace_ulid: Optional[str] = None
 
 
+@dataclass(slots=True, kw_only=True)
+class AlertPayload:
+    """Structured alert data, built once per result and rendered per channel.
+
+    Sentry receives it verbatim via asdict(); only Slack formats it as text.
+    """
+    totals: Dict[str, Any] = field(default_factory=dict)
+    per_model: List[Dict[str, Any]] = field(default_factory=list)
+    per_step: List[Dict[str, Any]] = field(default_factory=list)
+    anomalies: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+
 class CanaryTestError(Exception):
     """Exception raised when a canary test step fails."""
 
@@ -88,31 +309,60 @@ class AlertManager:
     """Manages alerting for canary test results."""
 
     # Baseline timings (expected durations in seconds)
-    BASELINE_TIMINGS = {
-        "step_01_landing": 3.0,
-        "step_02_click_get_report": 3.0,
-        "step_03_fill_email": 45.0,
-        "step_04_verify_user": 3.0,
-        "step_05_fill_otp": 70.0,
-        "step_06_workspace_details": 5.0,
-        "step_07_wait_categories": 60.0,
-        "step_08_approve_prompts": 90.0,
-        "step_09_wait_snapshot": 300.0,
-        "step_10_verify_dashboard": 5.0,
-        "step_11_full_verification": 2.0,
-    }
+    BASELINE_TIMINGS = BASELINE_TIMINGS
 
     def __init__(self):
         self.config = get_canary_config()
+        # Snapshot config values read on every alert
+        self._slack_url = self.config.SLACK_WEBHOOK_URL
+        self._has_slack = bool(self._slack_url)
+        self._brand_domain = self.config.TEST_BRAND_DOMAIN
+        self._http: Optional[httpx.AsyncClient] = None
+        # In-flight Slack posts, awaited by drain() before shutdown
+        self._pending: Set[asyncio.Task] = set()
+        self._slack_limit = asyncio.Semaphore(4)
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=httpx.Timeout(30.0),
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=10)
+            )
+        return self._http
+
+    def _schedule_slack_report(
+        self, result: CanaryResult, is_failure: bool, payload: Optional[AlertPayload] = None
+    ) -> None:
+        """Post the Slack report in the background so the caller isn't blocked."""
+        if not self._has_slack:
+            return
+        task = asyncio.create_task(self._send_slack_report(result, is_failure, payload))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def drain(self) -> None:
+        """Wait for in-flight Slack posts to finish."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def send_failure_alert(self, result: CanaryResult) -> None:
         """Send failure alerts to all configured channels."""
-        # Always send to Sentry
-        self._send_sentry_alert(result)
+        payload = self._build_payload(result)
+
+        # Slack is posted in the background; Sentry (blocking SDK) runs in a thread
+        self._schedule_slack_report(result, True, payload)
 
-        # Always send to Slack if configured
-        if self.config.SLACK_WEBHOOK_URL:
-            await self._send_slack_report(result, is_failure=True)
+        try:
+            await asyncio.to_thread(self._send_sentry_alert, result, payload)
+        except Exception as e:
+            logger.error(f"Alert channel failed: {e}")
 
     async def send_success_notification(self, result: CanaryResult) -> None:
         """Send success notification with full details."""
@@ -121,85 +371,168 @@ class AlertManager:
             f"in {result.metrics.total_duration_seconds:.1f}s"
         )
 
-        # Log to Sentry for monitoring
-        sentry_sdk.set_context("canary_success", {
-            "test_id": result.test_id,
-            "duration_seconds": result.metrics.total_duration_seconds,
-            "step_timings": result.metrics.step_timings,
-            "workspace_id": result.workspace_id
-        })
+        payload = self._build_payload(result)
 
-        # Send detailed Slack report
-        if self.config.SLACK_WEBHOOK_URL:
-            await self._send_slack_report(result, is_failure=False)
+        # Send detailed Slack report in the background
+        self._schedule_slack_report(result, False, payload)
 
-    def _send_sentry_alert(self, result: CanaryResult) -> None:
-        """Send alert to Sentry."""
+        # Log to Sentry for monitoring
         try:
-            with sentry_sdk.push_scope() as scope:
-                scope.set_tag("canary_test", "true")
-                scope.set_tag("test_id", result.test_id)
-                scope.set_tag("failed_step", result.failed_step or "unknown")
-
-                scope.set_context("canary_test", {
-                    "test_id": result.test_id,
-                    "failed_step": result.failed_step,
-                    "error_message": result.error_message,
-                    "total_duration_seconds": result.metrics.total_duration_seconds,
-                    "workspace_id": result.workspace_id,
-                    "workspace_ulid": result.workspace_ulid
-                })
+            await asyncio.to_thread(self._set_sentry_success_context, result, payload)
+        except Exception as e:
+            logger.error(f"Alert channel failed: {e}")
+
+    def _build_payload(self, result: CanaryResult) -> AlertPayload:
+        """Collect the numeric/structured alert data for a result."""
+        metrics = result.metrics
+        db_data = metrics.db_data or _EMPTY
+        model_stats = db_data.get("model_invocations") or _EMPTY
+
+        anomalies, warnings = self._collect_issues(result)
+        return AlertPayload(
+            totals={
+                "test_id": result.test_id,
+                "success": result.success,
+                "failed_step": result.failed_step,
+                "duration_seconds": metrics.total_duration_seconds,
+                "workspace_id": result.workspace_id,
+                "workspace_ulid": result.workspace_ulid,
+                "model_calls": model_stats.get("total_calls", 0),
+                "model_time": model_stats.get("total_time", 0),
+                "model_cost": model_stats.get("total_cost", 0),
+                "model_tokens": model_stats.get("total_tokens", 0),
+            },
+            per_model=list(model_stats.get("by_model") or ()),
+            per_step=[
+                {"step": step, "duration": duration, "baseline": BASELINE_TIMINGS.get(step), "ratio": ratio}
+                for step, duration, ratio in _iter_baseline_ratios(metrics.step_timings)
+            ],
+            anomalies=anomalies,
+            warnings=warnings
+        )
 
-                scope.set_context("step_timings", result.metrics.step_timings)
+    def _build_sentry_contexts(
+        self, result: CanaryResult, ctx_key: str = "canary_test", payload: Optional[AlertPayload] = None
+    ) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """Build Sentry tags and contexts for a result in one pass."""
+        tags = {
+            "canary_test": "true",
+            "test_id": result.test_id,
+            "failed_step": result.failed_step or "unknown"
+        }
+        contexts: Dict[str, Dict[str, Any]] = {
+            ctx_key: {
+                "test_id": result.test_id,
+                "failed_step": result.failed_step,
+                "error_message": result.error_message,
+                "total_duration_seconds": result.metrics.total_duration_seconds,
+                "workspace_id": result.workspace_id,
+                "workspace_ulid": result.workspace_ulid
+            },
+            "step_timings": result.metrics.step_timings
+        }
+        if result.db_state:
+            contexts["db_state"] = result.db_state
+        if result.metrics.errors:
+            contexts["errors"] = {"errors": [
+                {**err, "timestamp": _iso(err["timestamp"])} for err in result.metrics.errors
+            ]}
+        if payload is not None:
+            contexts["canary.payload"] = asdict(payload)
+        return tags, contexts
+
+    def _set_sentry_success_context(self, result: CanaryResult, payload: Optional[AlertPayload] = None) -> None:
+        """Attach success contexts to the current Sentry scope and record durations."""
+        _, contexts = self._build_sentry_contexts(result, ctx_key="canary_success", payload=payload)
+        for key, value in contexts.items():
+            sentry_sdk.set_context(key, value)
+
+        self._record_sentry_measurements(result)
+
+    def _record_sentry_measurements(self, result: CanaryResult) -> None:
+        """Send total and per-step durations as measurements on a canary transaction.
+
+        Transactions are subject to the SDK's traces_sample_rate, so this is
+        sampled like any other trace.
+        """
+        if not self.config.SENTRY_MEASUREMENTS:
+            return
 
-                if result.db_state:
-                    scope.set_context("db_state", result.db_state)
+        with sentry_sdk.start_transaction(op="canary", name="canary.run") as transaction:
+            transaction.set_tag("test_id", result.test_id)
+            transaction.set_measurement(
+                "canary.total_duration_s", result.metrics.total_duration_seconds, "second"
+            )
+            for step, duration in result.metrics.step_timings.items():
+                transaction.set_measurement(f"canary.{step}", duration, "second")
 
-                if result.metrics.errors:
-                    scope.set_context("errors", {"errors": result.metrics.errors})
+    def _send_sentry_alert(self, result: CanaryResult, payload: Optional[AlertPayload] = None) -> None:
+        """Send alert to Sentry."""
+        try:
+            with sentry_sdk.new_scope() as scope:
+                tags, contexts = self._build_sentry_contexts(result, payload=payload)
+                for key, value in tags.items():
+                    scope.set_tag(key, value)
+                for key, value in contexts.items():
+                    scope.set_context(key, value)
 
                 sentry_sdk.capture_message(
                     f"Canary Test Failed: {result.failed_step} - {result.error_message}",
                     level="error"
                 )
 
+                self._record_sentry_measurements(result)
+
             logger.info(f"Sent Sentry alert for canary test {result.test_id}")
 
         except Exception as e:
             logger.error(f"Failed to send Sentry alert: {e}")
 
-    async def _send_slack_report(self, result: CanaryResult, is_failure: bool) -> None:
+    async def _send_slack_report(
+        self, result: CanaryResult, is_failure: bool, payload: Optional[AlertPayload] = None
+    ) -> None:
         """Send detailed Slack report."""
-        if not self.config.SLACK_WEBHOOK_URL:
+        if not self._has_slack:
             return
 
         try:
-            message = self._build_detailed_slack_message(result, is_failure)
+            blocks = self._build_detailed_slack_message(result, is_failure, payload)["blocks"]
 
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.config.SLACK_WEBHOOK_URL,
-                    json=message,
-                    timeout=30.0
-                )
+            # Slack rejects messages with more than 50 blocks, so split long
+            # reports; parts are posted in order to keep the report readable
+            client = await self._get_client()
+            async with self._slack_limit:
+                for i in range(0, len(blocks), _SLACK_MAX_BLOCKS):
+                    message = {"blocks": blocks[i:i + _SLACK_MAX_BLOCKS]}
+                    response = await client.post(self._slack_url, content=_dumps(message), headers=_JSON_HEADERS)
+                    if response.status_code != 200:
+                        logger.error(f"Slack webhook returned {response.status_code}: {response.text}")
+                        return
 
-                if response.status_code != 200:
-                    logger.error(f"Slack webhook returned {response.status_code}: {response.text}")
-                else:
-                    logger.info(f"Sent Slack report for canary test {result.test_id}")
+            logger.info(f"Sent Slack report for canary test {result.test_id}")
 
         except Exception as e:
             logger.error(f"Failed to send Slack report: {e}")
 
-    def _build_detailed_slack_message(self, result: CanaryResult, is_failure: bool) -> Dict[str, Any]:
+    def _build_detailed_slack_message(
+        self, result: CanaryResult, is_failure: bool, payload: Optional[AlertPayload] = None
+    ) -> Dict[str, Any]:
         """Build detailed Slack message with all metrics."""
+        return {"blocks": list(self._iter_blocks(result, is_failure, payload))}
+
+    def _iter_blocks(
+        self, result: CanaryResult, is_failure: bool, payload: Optional[AlertPayload] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the Slack blocks of the detailed report in display order."""
+        if payload is None:
+            payload = self._build_payload(result)
 
-        config = self.config
         now = datetime.now(timezone.utc)
 
-        # Calculate Turkey time (UTC+3)
-        from datetime import timedelta
-        turkey_time = now + timedelta(hours=3)
+        # Format timestamps once: Turkey time (UTC+3) and UTC
+        stamp_tr = now.astimezone(TURKEY_TZ).strftime('%d %b %Y %H:%M')
+        stamp_utc = now.strftime('%H:%M UTC')
+        stamp_footer = now.strftime('%Y-%m-%d %H:%M:%S UTC')
 
         # Determine actual status based on DB data
         db_data = result.metrics.db_data
@@ -227,7 +560,7 @@ class AlertManager:
             header_color = "#36A64F"
 
         # Build step timings analysis
-        step_analysis = self._analyze_step_timings(result.metrics.step_timings)
+        step_analysis = self._analyze_step_timings(payload.per_step)
 
         # Build DB state summary
         db_summary = self._build_db_summary(result.db_state, result.metrics.db_data)
@@ -239,224 +572,112 @@ class AlertManager:
         slowest_steps = self._find_slowest_steps(result.metrics.step_timings)
 
         # Build anomalies list
-        anomalies = self._detect_anomalies(result, step_analysis)
-
-        blocks = [
-            # Header
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": f"{status_emoji} CANARY TEST RAPORU - {status_text}",
-                    "emoji": True
-                }
-            },
-            # Divider
-            {"type": "divider"},
-            # Date/Time prominently
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*📅 Test Zamanı:* `{turkey_time.strftime('%d %b %Y %H:%M')}` 🇹🇷 Türkiye\n_({now.strftime('%H:%M UTC')})_"
-                }
-            },
-            # Basic info
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*🆔 Test ID:*\n`{result.test_id}`"},
-                    {"type": "mrkdwn", "text": f"*⏱️ Toplam Süre:*\n`{result.metrics.total_duration_seconds:.1f}s`"}
-                ]
-            },
-            {
-                "type": "section",
-                "fields": [
-                    {"type": "mrkdwn", "text": f"*🌐 Domain:*\n{config.TEST_BRAND_DOMAIN}"},
-                    {"type": "mrkdwn", "text": f"*🏢 Workspace:*\n`{result.workspace_ulid or 'N/A'}`"}
-                ]
-            },
-        ]
+        anomalies = self._detect_anomalies(payload)
+
+        # Header
+        yield {
+            "type": "header",
+            "text": {
+                "type": "plain_text",
+                "text": f"{status_emoji} CANARY TEST RAPORU - {status_text}",
+                "emoji": True
+            }
+        }
+        yield _DIVIDER
+        # Date/Time prominently
+        yield _section(f"*📅 Test Zamanı:* `{stamp_tr}` 🇹🇷 Türkiye\n_({stamp_utc})_")
+        # Basic info
+        yield _fields(
+            f"*🆔 Test ID:*\n`{result.test_id}`",
+            f"*⏱️ Toplam Süre:*\n`{result.metrics.total_duration_seconds:.1f}s`"
+        )
+        yield _fields(
+            f"*🌐 Domain:*\n{self._brand_domain}",
+            f"*🏢 Workspace:*\n`{result.workspace_ulid or 'N/A'}`"
+        )
 
         # CRITICAL LOADING TIMES - User's key metrics
         loading_1 = result.metrics.step_timings.get("loading_1_form_to_prompts", 0)
         loading_2 = result.metrics.step_timings.get("loading_2_confirm_to_dashboard", 0)
 
         if loading_1 > 0 or loading_2 > 0:
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🚀 KRİTİK YÜKLENİYOR SÜRELERİ*"
-                }
-            })
+            yield _DIVIDER
+            yield _LOADING_HEADER
 
             loading_fields = []
             if loading_1 > 0:
                 l1_status = "🟢" if loading_1 < 60 else ("🟡" if loading_1 < 120 else "🔴")
-                loading_fields.append({
-                    "type": "mrkdwn",
-                    "text": f"*{l1_status} Loading 1:*\n`{loading_1:.1f}s`\n_Form → Prompts_"
-                })
+                loading_fields.append(f"*{l1_status} Loading 1:*\n`{loading_1:.1f}s`\n_Form → Prompts_")
             if loading_2 > 0:
                 l2_status = "🟢" if loading_2 < 90 else ("🟡" if loading_2 < 180 else "🔴")
-                loading_fields.append({
-                    "type": "mrkdwn",
-                    "text": f"*{l2_status} Loading 2:*\n`{loading_2:.1f}s`\n_Confirm → Dashboard_"
-                })
+                loading_fields.append(f"*{l2_status} Loading 2:*\n`{loading_2:.1f}s`\n_Confirm → Dashboard_")
 
-            if loading_fields:
-                blocks.append({
-                    "type": "section",
-                    "fields": loading_fields
-                })
+            yield _fields(*loading_fields)
 
         # Error info if failure
         if is_failure and result.error_message:
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*❌ Hata Detayı:*\n```{result.failed_step}: {result.error_message}```"
-                }
-            })
+            yield _DIVIDER
+            yield _section(f"*❌ Hata Detayı:*\n```{result.failed_step}: {result.error_message}```")
 
         # Step Timings
-        blocks.append({"type": "divider"})
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*📈 ADIM SÜRELERİ*"
-            }
-        })
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": step_analysis
-            }
-        })
+        yield _DIVIDER
+        yield _STEP_TIMINGS_HEADER
+        yield _section(step_analysis)
 
         # Slowest steps warning
         if slowest_steps:
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*⚠️ En Yavaş Adımlar:*\n{slowest_steps}"
-                }
-            })
+            yield _section(f"*⚠️ En Yavaş Adımlar:*\n{slowest_steps}")
 
         # DB Data
-        blocks.append({"type": "divider"})
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": "*📦 VERİ DURUMU (DB)*"
-            }
-        })
-        blocks.append({
-            "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": db_summary
-            }
-        })
+        yield _DIVIDER
+        yield _DB_HEADER
+        yield _section(db_summary)
 
         # Model Invocations (AI Stats)
         ai_summary = self._build_ai_summary(result.metrics.db_data)
         if ai_summary:
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🤖 AI MODEL SÜRELERİ*"
-                }
-            })
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": ai_summary
-                }
-            })
+            yield _DIVIDER
+            yield _AI_HEADER
+            yield _section(ai_summary)
 
         # UI Verification
         if ui_summary:
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "*🖥️ UI DOĞRULAMA*"
-                }
-            })
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": ui_summary
-                }
-            })
+            yield _DIVIDER
+            yield _UI_HEADER
+            yield _section(ui_summary)
 
         # Anomalies
         if anomalies:
-            blocks.append({"type": "divider"})
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*🔍 ANOMALİLER*\n{anomalies}"
-                }
-            })
+            yield _DIVIDER
+            yield _section(f"*🔍 ANOMALİLER*\n{anomalies}")
 
         # Footer
-        blocks.append({"type": "divider"})
-        blocks.append({
+        yield _DIVIDER
+        yield {
             "type": "context",
             "elements": [
                 {
                     "type": "mrkdwn",
-                    "text": f"Canary Test System | maxeo.ai | {now.strftime('%Y-%m-%d %H:%M:%S UTC')}"
+                    "text": f"Canary Test System | maxeo.ai | {stamp_footer}"
                 }
             ]
-        })
-
-        return {"blocks": blocks}
+        }
 
-    def _analyze_step_timings(self, timings: Dict[str, float]) -> str:
+    def _analyze_step_timings(self, per_step: List[Dict[str, Any]]) -> str:
         """Analyze step timings and create formatted output."""
-        if not timings:
+        if not per_step:
             return "Süre verisi yok"
+        return "\n".join(self._iter_step_timings(per_step))
 
-        lines = []
-        step_names = {
-            "setup": "Setup",
-            "step_01_landing": "1. Landing Page",
-            "step_02_click_get_report": "2. Get Report Click",
-            "step_03_fill_email": "3. Form Doldurma",
-            "step_04_verify_user": "4. User Doğrulama",
-            "step_05_fill_otp": "5. OTP İşlemi",
-            "step_06_workspace_details": "6. Workspace Oluşturma",
-            "step_07_wait_categories": "7. Categories Bekleme",
-            "step_08_approve_prompts": "8. Prompts Onaylama",
-            "step_09_wait_snapshot": "9. Snapshot Bekleme",
-            "step_10_verify_dashboard": "10. Dashboard Doğrulama",
-            "step_11_full_verification": "11. Final Doğrulama",
-        }
-
-        for step_key, duration in timings.items():
-            step_name = step_names.get(step_key, step_key)
-            baseline = self.BASELINE_TIMINGS.get(step_key, 0)
+    def _iter_step_timings(self, per_step: List[Dict[str, Any]]) -> Iterator[str]:
+        """Yield one line per step timing, compared to its baseline."""
+        for entry in per_step:
+            step_key, duration, ratio = entry["step"], entry["duration"], entry["ratio"]
+            step_name = _STEP_NAMES_TR.get(step_key, step_key)
 
             # Compare to baseline
-            if baseline > 0:
-                diff_pct = ((duration - baseline) / baseline) * 100
+            if ratio is not None:
+                diff_pct = (ratio - 1.0) * 100
                 if diff_pct > 20:
                     status = f"⚠️ +{diff_pct:.0f}%"
                 elif diff_pct < -20:
@@ -466,152 +687,136 @@ class AlertManager:
             else:
                 status = "ℹ️"
 
-            lines.append(f"• {step_name}: `{duration:.1f}s` {status}")
-
-        return "\n".join(lines)
+            yield f"• {step_name}: `{duration:.1f}s` {status}"
 
     def _build_db_summary(self, db_state: Optional[Dict], db_data: Dict) -> str:
         """Build DB data summary."""
-        lines = []
+        return "\n".join(self._iter_db_summary(db_state, db_data)) or "Veri toplanamadı ❌"
 
+    def _iter_db_summary(self, db_state: Optional[Dict], db_data: Dict) -> Iterator[str]:
+        """Yield DB data summary lines."""
         # From db_data (comprehensive data - PRIMARY SOURCE)
         if db_data and not db_data.get("error"):
             # Workspace info
-            ws = db_data.get("workspace", {})
-            if ws:
-                lines.append(f"*Workspace:* ✅")
-                lines.append(f"  • ID: `{ws.get('id', 'N/A')}`")
-                lines.append(f"  • ULID: `{ws.get('ulid', 'N/A')}`")
-                lines.append(f"  • Status: `{ws.get('status', 'N/A')}`")
+            if (ws := db_data.get("workspace")):
+                yield f"*Workspace:* ✅"
+                yield f"  • ID: `{ws.get('id', 'N/A')}`"
+                yield f"  • ULID: `{ws.get('ulid', 'N/A')}`"
+                yield f"  • Status: `{ws.get('status', 'N/A')}`"
 
             # Categories
             cat_count = db_data.get("categories_count", 0)
             cat_emoji = "✅" if cat_count >= 3 else "⚠️"
-            lines.append(f"\n*Categories:* `{cat_count}` {cat_emoji}")
-            if db_data.get("categories_list"):
-                for cat in db_data["categories_list"][:5]:
-                    lines.append(f"  • {cat.get('name', 'N/A')}")
+            yield f"\n*Categories:* `{cat_count}` {cat_emoji}"
+            if (categories := db_data.get("categories_list")):
+                for cat in categories[:5]:
+                    yield f"  • {cat.get('name', 'N/A')}"
 
             # Prompts
             prompt_count = db_data.get("prompts_count", 0)
             prompt_emoji = "✅" if prompt_count >= 15 else "⚠️"
-            lines.append(f"\n*Prompts:* `{prompt_count}` {prompt_emoji}")
-            if db_data.get("prompts_list"):
-                for prompt in db_data["prompts_list"][:5]:
+            yield f"\n*Prompts:* `{prompt_count}` {prompt_emoji}"
+            if (prompts := db_data.get("prompts_list")):
+                for prompt in prompts[:5]:
                     name = prompt.get('name', 'N/A')[:40]
                     is_tracked = "📍" if prompt.get('is_tracked') else ""
-                    lines.append(f"  • {name} {is_tracked}")
+                    yield f"  • {name} {is_tracked}"
 
             # Competitors
             comp_count = db_data.get("competitors_count", 0)
             comp_emoji = "✅" if comp_count >= 1 else "⚠️"
-            lines.append(f"\n*Competitors:* `{comp_count}` {comp_emoji}")
-            if db_data.get("competitors_list"):
-                for comp in db_data["competitors_list"][:5]:
-                    domain = comp.get('domain', '')
-                    lines.append(f"  • {comp.get('name', 'N/A')} ({domain})")
+            yield f"\n*Competitors:* `{comp_count}` {comp_emoji}"
+            if (competitors := db_data.get("competitors_list")):
+                for comp in competitors[:5]:
+                    yield f"  • {comp.get('name', 'N/A')} ({comp.get('domain', '')})"
 
             # Snapshot
-            snap = db_data.get("snapshot")
-            if snap:
+            if (snap := db_data.get("snapshot")):
                 snap_status = snap.get("status", "N/A")
                 snap_emoji = "✅" if snap_status == "COMPLETED" else "⚠️"
-                lines.append(f"\n*Snapshot:* `{snap_status}` {snap_emoji}")
-                lines.append(f"  • ID: `{snap.get('id', 'N/A')}`")
+                yield f"\n*Snapshot:* `{snap_status}` {snap_emoji}"
+                yield f"  • ID: `{snap.get('id', 'N/A')}`"
 
                 # Snapshot prompts status
-                sps = db_data.get("snapshot_prompts_status", {})
-                if sps:
-                    total = sps.get("total", 0)
-                    completed = sps.get("completed", 0)
-                    failed = sps.get("failed", 0)
-                    lines.append(f"  • Prompts: `{completed}/{total}` completed")
-                    if failed > 0:
-                        lines.append(f"  • Failed: `{failed}` ❌")
+                if (sps := db_data.get("snapshot_prompts_status")):
+                    yield f"  • Prompts: `{sps.get('completed', 0)}/{sps.get('total', 0)}` completed"
+                    if (failed := sps.get("failed", 0)) > 0:
+                        yield f"  • Failed: `{failed}` ❌"
             else:
-                lines.append(f"\n*Snapshot:* Yok ⚠️")
+                yield f"\n*Snapshot:* Yok ⚠️"
 
         # Fallback to db_state (verification results)
         elif db_state and "results" in db_state:
             results = db_state["results"]
 
-            ws = results.get("workspace", {})
-            if ws:
-                ws_data = ws.get("data", {})
+            if (ws := results.get("workspace")):
                 status_emoji = "✅" if ws.get("success") else "❌"
-                lines.append(f"*Workspace:* {status_emoji}")
-                if ws_data:
-                    lines.append(f"  • ID: `{ws_data.get('workspace_id', 'N/A')}`")
-                    lines.append(f"  • ULID: `{ws_data.get('ulid', 'N/A')}`")
+                yield f"*Workspace:* {status_emoji}"
+                if (ws_data := ws.get("data")):
+                    yield f"  • ID: `{ws_data.get('workspace_id', 'N/A')}`"
+                    yield f"  • ULID: `{ws_data.get('ulid', 'N/A')}`"
 
-            ws_status = results.get("workspace_status", {})
-            if ws_status:
+            if (ws_status := results.get("workspace_status")):
                 status_emoji = "✅" if ws_status.get("success") else "❌"
-                actual_status = ws_status.get("data", {}).get("actual_status", "N/A")
-                lines.append(f"*Status:* `{actual_status}` {status_emoji}")
+                actual_status = (ws_status.get("data") or _EMPTY).get("actual_status", "N/A")
+                yield f"*Status:* `{actual_status}` {status_emoji}"
 
-            cats = results.get("categories", {})
-            if cats:
+            if (cats := results.get("categories")):
                 status_emoji = "✅" if cats.get("success") else "❌"
-                count = cats.get("data", {}).get("categories_count", 0)
-                lines.append(f"*Categories:* `{count}` {status_emoji}")
+                count = (cats.get("data") or _EMPTY).get("categories_count", 0)
+                yield f"*Categories:* `{count}` {status_emoji}"
 
-            prompts = results.get("prompts", {})
-            if prompts:
+            if (prompts := results.get("prompts")):
                 status_emoji = "✅" if prompts.get("success") else "❌"
-                count = prompts.get("data", {}).get("prompts_count", 0)
-                lines.append(f"*Prompts:* `{count}` {status_emoji}")
+                count = (prompts.get("data") or _EMPTY).get("prompts_count", 0)
+                yield f"*Prompts:* `{count}` {status_emoji}"
 
-            snapshot = results.get("snapshot", {})
-            if snapshot:
+            if (snapshot := results.get("snapshot")):
                 status_emoji = "✅" if snapshot.get("success") else "❌"
-                snap_data = snapshot.get("data", {})
-                snap_status = snap_data.get("status", "N/A")
-                lines.append(f"*Snapshot:* `{snap_status}` {status_emoji}")
+                snap_status = (snapshot.get("data") or _EMPTY).get("status", "N/A")
+                yield f"*Snapshot:* `{snap_status}` {status_emoji}"
 
-            competitors = results.get("competitors", {})
-            if competitors:
+            if (competitors := results.get("competitors")):
                 status_emoji = "✅" if competitors.get("success") else "❌"
-                count = competitors.get("data", {}).get("competitors_count", 0)
-                lines.append(f"*Competitors:* `{count}` {status_emoji}")
-
-        return "\n".join(lines) if lines else "Veri toplanamadı ❌"
+                count = (competitors.get("data") or _EMPTY).get("competitors_count", 0)
+                yield f"*Competitors:* `{count}` {status_emoji}"
 
     def _build_ui_summary(self, ui_data: Dict) -> str:
         """Build UI verification summary."""
         if not ui_data:
             return ""
+        return "\n".join(self._iter_ui_summary(ui_data))
 
-        lines = []
-
+    def _iter_ui_summary(self, ui_data: Dict) -> Iterator[str]:
+        """Yield UI verification summary lines."""
         if "dashboard_loaded" in ui_data:
             status = "✅" if ui_data["dashboard_loaded"] else "❌"
-            lines.append(f"• Dashboard yüklendi: {status}")
+            yield f"• Dashboard yüklendi: {status}"
 
         if "charts_visible" in ui_data:
             status = "✅" if ui_data["charts_visible"] else "❌"
-            lines.append(f"• Charts görünür: {status}")
+            yield f"• Charts görünür: {status}"
 
         if "current_url" in ui_data:
-            lines.append(f"• URL: `{ui_data['current_url']}`")
+            yield f"• URL: `{ui_data['current_url']}`"
 
         if "page_title" in ui_data:
-            lines.append(f"• Sayfa: {ui_data['page_title']}")
-
-        return "\n".join(lines) if lines else ""
+            yield f"• Sayfa: {ui_data['page_title']}"
 
     def _build_ai_summary(self, db_data: Dict) -> str:
         """Build AI model invocation summary."""
         if not db_data:
             return ""
+        return "\n".join(self._iter_ai_summary(db_data))
+
+    def _iter_ai_summary(self, db_data: Dict) -> Iterator[str]:
+        """Yield AI model invocation summary lines."""
 
         model_stats = db_data.get("model_invocations", {})
         slowest = db_data.get("slowest_invocations", [])
 
         if not model_stats or model_stats.get("total_calls", 0) == 0:
-            return ""
-
-        lines = []
+            return
 
         # Total stats
         total_time = model_stats.get("total_time", 0)
@@ -619,14 +824,14 @@ class AlertManager:
         total_calls = model_stats.get("total_calls", 0)
         total_tokens = model_stats.get("total_tokens", 0)
 
-        lines.append(f"*Toplam:* `{total_calls}` çağrı, `{total_time:.1f}s` süre, `${total_cost:.4f}` maliyet")
+        yield f"*Toplam:* `{total_calls}` çağrı, `{total_time:.1f}s` süre, `${total_cost:.4f}` maliyet"
         if total_tokens > 0:
-            lines.append(f"*Tokenlar:* `{total_tokens:,}` toplam")
+            yield f"*Tokenlar:* `{total_tokens:,}` toplam"
 
         # By model breakdown
         by_model = model_stats.get("by_model", [])
         if by_model:
-            lines.append("\n*Model Bazında:*")
+            yield "\n*Model Bazında:*"
             for m in by_model[:5]:  # Top 5 models
                 model_name = m.get("model", "?")
                 # Shorten model name for display
@@ -638,11 +843,11 @@ class AlertManager:
                 calls = m.get("call_count", 0)
                 time = m.get("total_time", 0)
                 cost = m.get("total_cost", 0)
-                lines.append(f"  • `{model_name}`: {calls}x, {time:.1f}s, ${cost:.4f}")
+                yield f"  • `{model_name}`: {calls}x, {time:.1f}s, ${cost:.4f}"
 
         # Slowest invocations
         if slowest:
-            lines.append("\n*En Yavaş Çağrılar:*")
+            yield "\n*En Yavaş Çağrılar:*"
             for s in slowest[:3]:  # Top 3 slowest
                 model = s.get("model", "?")
                 if "/" in model:
@@ -650,34 +855,21 @@ class AlertManager:
                 if len(model) > 20:
                     model = model[:17] + "..."
                 elapsed = s.get("time_elapsed", 0)
-                lines.append(f"  • `{model}`: {elapsed:.1f}s")
-
-        return "\n".join(lines)
+                yield f"  • `{model}`: {elapsed:.1f}s"
 
     def _find_slowest_steps(self, timings: Dict[str, float]) -> str:
         """Find the slowest steps."""
         if not timings:
             return ""
 
-        # Sort by duration
-        sorted_steps = sorted(timings.items(), key=lambda x: x[1], reverse=True)
-
         # Get top 3 slowest
-        slowest = sorted_steps[:3]
+        slowest = heapq.nlargest(3, timings.items(), key=itemgetter(1))
 
         lines = []
-        step_names = {
-            "step_03_fill_email": "Form Doldurma",
-            "step_05_fill_otp": "OTP İşlemi",
-            "step_07_wait_categories": "Categories",
-            "step_08_approve_prompts": "Prompts",
-            "step_09_wait_snapshot": "Snapshot",
-        }
-
         for step, duration in slowest:
             if duration > 30:  # Only show if > 30s
-                name = step_names.get(step, step)
-                baseline = self.BASELINE_TIMINGS.get(step, 0)
+                name = _SLOW_STEP_NAMES_TR.get(step, step)
+                baseline = BASELINE_TIMINGS.get(step, 0)
                 if baseline > 0:
                     diff = duration - baseline
                     if diff > 0:
@@ -685,78 +877,30 @@ class AlertManager:
 
         return "\n".join(lines) if lines else ""
 
-    def _detect_anomalies(self, result: CanaryResult, step_analysis: str) -> str:
-        """Detect anomalies in the test result."""
+    def _collect_issues(self, result: CanaryResult) -> Tuple[List[str], List[str]]:
+        """Collect anomaly and warning messages for a result."""
         anomalies = []
         warnings = []
 
-        # Check from comprehensive DB data
-        db_data = result.metrics.db_data
-        if db_data and not db_data.get("error"):
-            ws = db_data.get("workspace", {})
-            ws_status = ws.get("status", "UNKNOWN")
-
-            # Workspace status check
-            if ws_status != "COMPLETED":
-                anomalies.append(f"🚨 Workspace status `{ws_status}` - COMPLETED olmalı!")
-
-            # Prompts check
-            prompt_count = db_data.get("prompts_count", 0)
-            if prompt_count < 15:
-                anomalies.append(f"🚨 Prompts: `{prompt_count}` - minimum 15 olmalı!")
-            elif prompt_count < 20:
-                warnings.append(f"⚠️ Prompts düşük: `{prompt_count}`")
-
-            # Snapshot check
-            snap = db_data.get("snapshot")
-            if not snap:
-                anomalies.append("🚨 Snapshot oluşmamış!")
-            elif snap.get("status") != "COMPLETED":
-                anomalies.append(f"🚨 Snapshot status: `{snap.get('status')}` - COMPLETED olmalı!")
-
-            # Snapshot prompts check
-            sps = db_data.get("snapshot_prompts_status", {})
-            if sps:
-                failed = sps.get("failed", 0)
-                if failed > 0:
-                    anomalies.append(f"🚨 {failed} snapshot prompt başarısız!")
-
-            # Competitors check
-            comp_count = db_data.get("competitors_count", 0)
-            if comp_count == 0:
-                warnings.append("⚠️ Competitor bulunamadı")
-
-        # Fallback to db_state
-        elif result.db_state and "results" in result.db_state:
-            results = result.db_state["results"]
-
-            ws_status = results.get("workspace_status", {})
-            if ws_status and not ws_status.get("success"):
-                actual = ws_status.get("data", {}).get("actual_status", "?")
-                anomalies.append(f"🚨 Workspace status `{actual}` - COMPLETED olmalı!")
-
-            prompts = results.get("prompts", {})
-            if prompts and not prompts.get("success"):
-                count = prompts.get("data", {}).get("prompts_count", 0)
-                anomalies.append(f"🚨 Prompts: `{count}` - minimum 15 olmalı!")
-
-            snapshot = results.get("snapshot", {})
-            if snapshot and not snapshot.get("success"):
-                anomalies.append("🚨 Snapshot oluşmamış!")
+        # Check DB state (comprehensive db_data, falling back to db_state)
+        db = _normalize_db(result)
+        if db.valid:
+            anomalies.extend(msg for _, rule in _ANOMALY_RULES if (msg := rule(db)) is not None)
+            warnings.extend(msg for _, rule in _WARNING_RULES if (msg := rule(db)) is not None)
 
         # Check step timings for slowness
-        for step, duration in result.metrics.step_timings.items():
-            baseline = self.BASELINE_TIMINGS.get(step, 0)
-            if baseline > 0:
-                ratio = duration / baseline
-                if ratio > 2.0:
-                    step_name = step.replace("step_", "").replace("_", " ").title()
-                    warnings.append(f"⚠️ `{step_name}` %{int((ratio-1)*100)} yavaş ({duration:.1f}s vs {baseline:.1f}s)")
-                elif ratio > 1.5:
-                    pass  # Minor slowness, don't report
-
-        # Combine anomalies and warnings
-        all_issues = anomalies + warnings
+        for step, duration, ratio in _iter_baseline_ratios(result.metrics.step_timings):
+            # Only report steps more than 2x slower than baseline
+            if ratio is not None and ratio > 2.0:
+                baseline = BASELINE_TIMINGS[step]
+                step_name = step.replace("step_", "").replace("_", " ").title()
+                warnings.append(f"⚠️ `{step_name}` %{int((ratio-1)*100)} yavaş ({duration:.1f}s vs {baseline:.1f}s)")
+
+        return anomalies, warnings
+
+    def _detect_anomalies(self, payload: AlertPayload) -> str:
+        """Format the anomalies and warnings of an alert payload."""
+        all_issues = payload.anomalies + payload.warnings
         if all_issues:
             return "\n".join(all_issues)
         else:
@@ -9,9 +9,12 @@ It uses raw SQL queries instead of ORM models to avoid complex dependencies.
 """
 
 import asyncio
+import logging
 import os
+import re
 import time
-from datetime import datetime, timezone
+from collections import deque
+from time import perf_counter
 from typing import Optional
 
 from canary.config import get_canary_config, CanaryConfig
@@ -23,10 +26,32 @@ from canary.alerting import (
     CanaryMetrics,
     AlertManager
 )
-from canary.utils import get_canary_logger, get_database_url
+from canary.utils import (
+    first_completed,
+    get_canary_logger,
+    get_database_url,
+    run_on_fast_loop,
+    poll_delays
+)
 
 logger = get_canary_logger("canary.test")
 
+# Step 4: how long to keep rechecking for the user row, and how often (seconds)
+USER_CREATED_TIMEOUT = 5
+USER_RECHECK_INTERVAL = 0.25
+
+# Step 3: console messages kept while the form submits, and which count as errors
+CONSOLE_BUFFER_SIZE = 256
+_CONSOLE_ERROR_RE = re.compile(r"error|fail", re.IGNORECASE)
+
+# Seconds between "... waiting" progress lines in the DB polling loops
+PROGRESS_LOG_INTERVAL = 10
+
+# Step 9: extra time after SNAPSHOT_WAIT_TIMEOUT for the workspace to reach
+# COMPLETED, and the snapshot statuses that end the snapshot wait
+WORKSPACE_COMPLETED_TIMEOUT = 120
+_SNAPSHOT_SETTLED = frozenset({"COMPLETED", "FAILED"})
+
 
 class CanaryTest:
     """
@@ -45,6 +70,9 @@ class CanaryTest:
     10. Cleanup
     """
 
+    # Separator line around step headers in the log
+    _BANNER = "=" * 60
+
     def __init__(self, database_url: Optional[str] = None):
         self.config = get_canary_config()
         self.test_id = f"canary-{int(time.time())}"
@@ -65,6 +93,10 @@ class CanaryTest:
         self.prompts_confirmed_time: Optional[float] = None
         self.db_state: Optional[dict] = None
 
+        # Final-state rows seen in step 9, reused by step 11's verification
+        self._final_workspace_row: Optional[dict] = None
+        self._final_snapshot_row: Optional[dict] = None
+
         # CRITICAL LOADING TIMES - User's key metrics
         # Loading 1: Form submit → Prompts modal ready
         self.form_submitted_time: Optional[float] = None  # When "Get Report" clicked
@@ -81,7 +113,7 @@ class CanaryTest:
         Returns:
             CanaryResult with success status and metrics
         """
-        self.metrics.start_time = datetime.now(timezone.utc)
+        self.metrics.start_time_ns = time.time_ns()
         logger.info(f"Starting canary test: {self.test_id}")
         logger.info(f"Test email: {self.test_email}")
 
@@ -103,7 +135,7 @@ class CanaryTest:
             await self._step_11_full_verification()
 
             # Success
-            self.metrics.end_time = datetime.now(timezone.utc)
+            self.metrics.end_time_ns = time.time_ns()
 
             result = CanaryResult(
                 success=True,
@@ -123,14 +155,14 @@ class CanaryTest:
             return result
 
         except CanaryTestError as e:
-            self.metrics.end_time = datetime.now(timezone.utc)
+            self.metrics.end_time_ns = time.time_ns()
             self.metrics.record_error(e.step, e.message, e.details)
 
             # Get DB state for debugging
             db_state = None
             if self.db_verifier:
                 try:
-                    db_state = self.db_verifier.full_verification()
+                    db_state = await self._db(self._full_verification)
                 except Exception as db_err:
                     logger.error(f"Failed to get DB state: {db_err}")
 
@@ -151,7 +183,7 @@ class CanaryTest:
             return result
 
         except Exception as e:
-            self.metrics.end_time = datetime.now(timezone.utc)
+            self.metrics.end_time_ns = time.time_ns()
             self.metrics.record_error("UNEXPECTED", str(e))
 
             result = CanaryResult(
@@ -174,19 +206,66 @@ class CanaryTest:
 
     async def _setup(self) -> None:
         """Initialize all components."""
-        start = time.time()
+        start = perf_counter()
         logger.info("Setting up canary test components")
 
-        # Initialize browser
         self.browser = BrowserAutomation()
-        await self.browser.setup()
-
-        # Initialize DB verifier with connection string
         self.db_verifier = DBVerifier(self.database_url, self.test_email)
 
-        self.metrics.record_step_timing("setup", time.time() - start)
+        # Launch the browser and open the DB connections together
+        await asyncio.gather(
+            self.browser.setup(),
+            self._db(self.db_verifier.warm_up),
+            self.db_verifier.open_pool()
+        )
+
+        self.metrics.record_step_timing("setup", perf_counter() - start)
         logger.info("Setup complete")
 
+    async def _poll_db_for_prompts(self, label: str) -> int:
+        """Poll the DB until enough prompts exist and return their count.
+
+        Runs until cancelled; callers bound it with a timeout or a race.
+        """
+        waited = next_log = 0
+        for delay in poll_delays(self.config.POLLING_INTERVAL):
+            snap = await self._db(self.db_verifier.get_workspace_snapshot)
+            if snap and snap["prompts_count"] >= self.config.MIN_PROMPTS_COUNT:
+                return snap["prompts_count"]
+
+            if snap and waited >= next_log:
+                logger.info(f"  [{label}] ... waiting ({waited:.0f}s), status={snap['status']}, prompts={snap['prompts_count']}")
+                next_log += PROGRESS_LOG_INTERVAL
+
+            await asyncio.sleep(delay)
+            waited += delay
+
+    async def _is_completed(self) -> bool:
+        """Check whether the workspace already reached COMPLETED (steps 7-9 fast path)."""
+        result = await self.db_verifier.verify_workspace_status_async("COMPLETED")
+        if result.success:
+            # verify_workspace_status just refreshed the cached row
+            self._final_workspace_row = self.db_verifier.get_workspace()
+        return result.success
+
+    async def _current_workspace(self) -> Optional[dict]:
+        """Get the workspace row, reusing the COMPLETED row steps 7-9 already read."""
+        if self._final_workspace_row is not None:
+            return self._final_workspace_row
+        return await self.db_verifier.refresh_workspace_async()
+
+    def _full_verification(self) -> dict:
+        """Run DBVerifier.full_verification on one read-only connection (blocking)."""
+        with self.db_verifier:
+            return self.db_verifier.full_verification()
+
+    async def _db(self, fn, *args, **kwargs):
+        """Run a blocking DBVerifier call in a worker thread.
+
+        Keeps the event loop free for Playwright while the query runs.
+        """
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
     async def _cleanup_test_data(self) -> None:
         """
         Clean up test data from database after successful test.
@@ -202,12 +281,12 @@ class CanaryTest:
             logger.warning("DB verifier not available for cleanup")
             return
 
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
         logger.info("CLEANUP: Soft deleting test data")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
 
         try:
-            cleanup_result = self.db_verifier.cleanup_test_data()
+            cleanup_result = await self._db(self.db_verifier.cleanup_test_data)
 
             if cleanup_result["workspace_deleted"]:
                 logger.info(f"  ✓ Workspace {self.workspace_id} soft deleted")
@@ -232,60 +311,66 @@ class CanaryTest:
         """Cleanup resources and test data."""
         logger.info("Cleaning up canary test")
 
-        # Cleanup browser
+        # Browser teardown and DB dispose are independent; run them together
+        closers = {}
         if self.browser:
-            try:
-                await self.browser.cleanup()
-            except Exception as e:
-                logger.error(f"Browser cleanup error: {e}")
-
-        # Close DB connection
+            closers["Browser"] = self.browser.cleanup()
         if self.db_verifier:
-            try:
-                self.db_verifier.close()
-            except Exception as e:
-                logger.error(f"DB cleanup error: {e}")
+            closers["DB"] = asyncio.to_thread(self.db_verifier.close)
+            closers["DB pool"] = self.db_verifier.close_pool()
+
+        results = await asyncio.gather(*closers.values(), return_exceptions=True)
+        for label, result in zip(closers, results):
+            if isinstance(result, Exception):
+                logger.error(f"{label} cleanup error: {result}")
+
+        # Let background Slack posts finish, then close the HTTP client
+        try:
+            await self.alert_manager.drain()
+            await self.alert_manager.aclose()
+        except Exception as e:
+            logger.error(f"Alert manager cleanup error: {e}")
 
     async def _step_01_navigate_to_landing(self) -> None:
         """Step 1: Navigate to landing page."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 1: NAVIGATE TO LANDING PAGE")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
         logger.info(f"  Target URL: {self.config.BASE_URL}")
 
         await self.browser.navigate_to_landing()
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_01_landing", duration)
         logger.info(f"  ✓ STEP 1 COMPLETED in {duration:.2f}s")
 
     async def _step_02_click_get_report(self) -> None:
         """Step 2: Click Get Report button."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 2: CLICK GET REPORT BUTTON")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
 
         await self.browser.click_get_report_button()
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_02_click_get_report", duration)
         logger.info(f"  ✓ STEP 2 COMPLETED in {duration:.2f}s")
 
     async def _step_03_fill_email_and_submit(self) -> None:
         """Step 3: Fill email and submit to trigger OTP."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 3: FILL FORM AND SUBMIT")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
         logger.info(f"  Brand URL: {self.config.TEST_BRAND_DOMAIN}")
         logger.info(f"  Email: {self.test_email}")
         logger.info(f"  Name: {self.config.TEST_FIRST_NAME} {self.config.TEST_LAST_NAME}")
         logger.info(f"  Country: {self.config.TEST_COUNTRY}, Language: {self.config.TEST_LANGUAGE}")
 
         # Fill workspace form with test data
-        fill_start = time.time()
+        fill_start = perf_counter()
         logger.info("  [3.1] Filling form fields...")
         await self.browser.fill_workspace_form(
             brand_url=self.config.TEST_BRAND_DOMAIN,
@@ -296,93 +381,96 @@ class CanaryTest:
             country=self.config.TEST_COUNTRY,
             language=self.config.TEST_LANGUAGE
         )
-        logger.info(f"  [3.1] Form filled in {time.time() - fill_start:.2f}s")
-
-        # Enable console log capture before submission
-        console_messages = []
-        self.browser.page.on("console", lambda msg: console_messages.append(f"{msg.type}: {msg.text}"))
-
-        # Submit the form
-        submit_start = time.time()
-        logger.info("  [3.2] Submitting form...")
-        await self.browser.submit_workspace_form()
-        self.form_submitted_time = time.time()  # LOADING 1 START
-        logger.info(f"  [3.2] Submit clicked in {time.time() - submit_start:.2f}s")
-        logger.info(f"  [3.2] 🚀 LOADING 1 STARTED (form submitted)")
-
-        # Wait a moment for the page to react and collect any errors
-        logger.info("  [3.3] Waiting 3s for page reaction...")
-        await asyncio.sleep(3)
-
-        # Log any console errors
-        error_count = 0
-        for msg in console_messages:
-            if "error" in msg.lower() or "fail" in msg.lower():
-                logger.warning(f"  ⚠ Console: {msg}")
-                error_count += 1
-        if error_count == 0:
-            logger.info("  [3.3] No console errors detected")
+        logger.info(f"  [3.1] Form filled in {perf_counter() - fill_start:.2f}s")
 
-        # Log current URL for debugging
-        current_url = await self.browser.get_current_url()
-        logger.info(f"  [3.4] Current URL: {current_url}")
+        # Capture console output (bounded) from submission until the OTP
+        # screen, so errors from the submit XHR are still reported
+        console_messages = deque(maxlen=CONSOLE_BUFFER_SIZE)
 
-        # Check for any error messages on the page
+        def on_console(msg):
+            console_messages.append(f"{msg.type}: {msg.text}")
+
+        # Logs and drops the errors captured so far; returns how many
+        def log_console_errors() -> int:
+            errors = [msg for msg in console_messages if _CONSOLE_ERROR_RE.search(msg)]
+            console_messages.clear()
+            for msg in errors:
+                logger.warning(f"  ⚠ Console: {msg}")
+            return len(errors)
+
+        self.browser.page.on("console", on_console)
         try:
-            error_text = await self.browser.page.evaluate("""
-                () => {
-                    const selectors = [
-                        '.error', '.error-message', '[class*="error"]',
-                        '.snackbar', '[class*="snackbar"]', '[class*="toast"]',
-                        '[role="alert"]'
-                    ];
-                    for (const selector of selectors) {
-                        const el = document.querySelector(selector);
-                        if (el && el.textContent) {
-                            return el.textContent.trim();
-                        }
+            # Submit the form
+            submit_start = perf_counter()
+            logger.info("  [3.2] Submitting form...")
+            await self.browser.submit_workspace_form()
+            self.form_submitted_time = perf_counter()  # LOADING 1 START
+            logger.info(f"  [3.2] Submit clicked in {perf_counter() - submit_start:.2f}s")
+            logger.info(f"  [3.2] 🚀 LOADING 1 STARTED (form submitted)")
+
+            # Wait for the page to settle and collect any errors
+            logger.info("  [3.3] Waiting for page reaction...")
+            await self.browser.wait_for_ready_state()
+
+            # Log any console errors
+            if not log_console_errors():
+                logger.info("  [3.3] No console errors detected")
+
+            # Log current URL for debugging
+            current_url = self.browser.url
+            logger.info(f"  [3.4] Current URL: {current_url}")
+
+            # Check for any error messages on the page
+            try:
+                error_text = await self.browser.page.evaluate("""
+                    () => {
+                        // One DOM walk for all error/toast selectors
+                        const el = document.querySelector(
+                            '.error, .error-message, [class*="error"], ' +
+                            '.snackbar, [class*="snackbar"], [class*="toast"], ' +
+                            '[role="alert"]'
+                        );
+                        return el && el.textContent ? el.textContent.trim() : null;
                     }
-                    return null;
-                }
-            """)
-            if error_text:
-                logger.warning(f"  ⚠ Page error: {error_text}")
-            else:
-                logger.info("  [3.4] No page errors found")
-        except Exception as e:
-            logger.debug(f"  Could not check for error messages: {e}")
+                """)
+                if error_text:
+                    logger.warning(f"  ⚠ Page error: {error_text}")
+                else:
+                    logger.info("  [3.4] No page errors found")
+            except Exception as e:
+                logger.debug("  Could not check for error messages: %s", e)
 
-        # Take screenshot to debug
-        try:
+            # Take screenshot to debug (written in the background)
             screenshot_path = f"/tmp/canary_after_submit_{self.test_id}.png"
-            await self.browser.take_screenshot(screenshot_path)
+            self.browser.queue_screenshot(screenshot_path)
             logger.info(f"  [3.5] Screenshot: {screenshot_path}")
-        except Exception as e:
-            logger.warning(f"  Could not take screenshot: {e}")
 
-        # Wait for OTP input to appear
-        otp_wait_start = time.time()
-        logger.info("  [3.6] Waiting for OTP input screen...")
-        await self.browser.wait_for_otp_input()
-        logger.info(f"  [3.6] OTP screen appeared in {time.time() - otp_wait_start:.2f}s")
+            # Wait for OTP input to appear
+            otp_wait_start = perf_counter()
+            logger.info("  [3.6] Waiting for OTP input screen...")
+            await self.browser.wait_for_otp_input()
+            logger.info(f"  [3.6] OTP screen appeared in {perf_counter() - otp_wait_start:.2f}s")
+        finally:
+            self.browser.page.remove_listener("console", on_console)
+            # Errors logged after [3.3] (e.g. the submit XHR failing)
+            log_console_errors()
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_03_fill_email", duration)
         logger.info(f"  ✓ STEP 3 COMPLETED in {duration:.2f}s")
 
     async def _step_04_verify_user_created(self) -> None:
         """Step 4: Verify user was created in DB."""
-        start = time.time()
+        start = perf_counter()
         logger.info("Step 4: Verifying user created")
 
-        # Wait a bit for user creation
-        await asyncio.sleep(2)
-
-        # Refresh session to see new data
-        # DB verifier handles fresh queries automatically
-
-        # Verify user exists
-        result = self.db_verifier.verify_user_exists()
+        # Verify user exists, rechecking briefly while the row is committed
+        await self.browser.wait_for_ready_state()
+        result = await self._db(self.db_verifier.verify_user_exists)
+        deadline = perf_counter() + USER_CREATED_TIMEOUT
+        while not result.success and perf_counter() < deadline:
+            await asyncio.sleep(USER_RECHECK_INTERVAL)
+            result = await self._db(self.db_verifier.verify_user_exists)
         if not result.success:
             raise CanaryTestError(
                 "STEP_04_VERIFY_USER",
@@ -390,25 +478,25 @@ class CanaryTest:
             )
 
         logger.info(f"User verified: {result.data}")
-        self.metrics.record_step_timing("step_04_verify_user", time.time() - start)
+        self.metrics.record_step_timing("step_04_verify_user", perf_counter() - start)
 
     async def _step_05_fill_otp(self) -> None:
         """Step 5: Get OTP from DB and fill it."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 5: GET AND FILL OTP CODE")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
 
         # Check if OTP should be skipped (for local development)
         if self.config.SKIP_OTP_VERIFICATION:
             logger.warning("SKIP_OTP_VERIFICATION is enabled - skipping OTP step")
             logger.warning("Note: This is for local development only. Full test requires production environment.")
-            self.metrics.record_step_timing("step_05_fill_otp", time.time() - start)
+            self.metrics.record_step_timing("step_05_fill_otp", perf_counter() - start)
             return
 
         # Get OTP from DB
         logger.info("  [5.1] Fetching OTP code from database...")
-        otp_code = self.db_verifier.get_otp_code()
+        otp_code = await self._db(self.db_verifier.get_otp_code)
         if not otp_code:
             raise CanaryTestError(
                 "STEP_05_GET_OTP",
@@ -430,13 +518,13 @@ class CanaryTest:
 
         # Take screenshot after transition
         screenshot_path = f"/tmp/canary_after_otp_{self.test_id}.png"
-        await self.browser.take_screenshot(screenshot_path)
+        self.browser.queue_screenshot(screenshot_path)
         logger.info(f"  [5.4] Post-OTP screenshot: {screenshot_path}")
 
-        current_url = await self.browser.get_current_url()
+        current_url = self.browser.url
         logger.info(f"  [5.4] Current URL after OTP: {current_url}")
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_05_fill_otp", duration)
         logger.info(f"  ✓ STEP 5 COMPLETED in {duration:.2f}s")
 
@@ -447,25 +535,29 @@ class CanaryTest:
         The modal shows "Setting up your topics..." loading while categories are generated.
         We should NOT navigate away - the prompts will appear in the same modal.
         """
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 6: WAIT FOR WORKSPACE CREATION & TOPICS LOADING")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
 
         # Wait for workspace to be created in DB
         max_wait = 60
         waited = 0
+        next_log = PROGRESS_LOG_INTERVAL
+        delays = poll_delays(2)
         while waited < max_wait:
-            result = self.db_verifier.verify_workspace_created()
+            result = await self._db(self.db_verifier.verify_workspace_created)
             if result.success:
                 self.workspace_id = result.data.get("workspace_id")
                 self.workspace_ulid = result.data.get("ulid")
                 logger.info(f"  [6.1] Workspace created: ID={self.workspace_id}, ULID={self.workspace_ulid}")
                 break
-            await asyncio.sleep(2)
-            waited += 2
-            if waited % 10 == 0:
-                logger.info(f"  [6.1] ... waiting for workspace ({waited}s)")
+            delay = next(delays)
+            await asyncio.sleep(delay)
+            waited += delay
+            if waited >= next_log:
+                logger.info(f"  [6.1] ... waiting for workspace ({waited:.0f}s)")
+                next_log += PROGRESS_LOG_INTERVAL
 
         if not self.workspace_id:
             raise CanaryTestError(
@@ -474,41 +566,28 @@ class CanaryTest:
             )
 
         # Check current URL
-        current_url = await self.browser.get_current_url()
+        current_url = self.browser.url
         logger.info(f"  [6.2] Current URL: {current_url}")
 
         # Take screenshot to see modal state
-        await self.browser.take_screenshot(f"/tmp/canary_step6_modal_{self.test_id}.png")
-        logger.info(f"  [6.2] Screenshot saved")
+        self.browser.queue_screenshot(f"/tmp/canary_step6_modal_{self.test_id}.png")
+        logger.info(f"  [6.2] Screenshot queued")
 
         # Check for loading indicators in the modal
         # The modal should show "Setting up your topics..." or similar
         logger.info("  [6.3] Checking for loading state in modal...")
+        await self.browser.wait_for_dom_ready()
+
+        page_state = await self.browser.probe_modal_state(
+            "setting up|topics|analyzing|loading|prompts|confirm"
+        )
 
-        page_state = await self.browser.page.evaluate("""
-            () => {
-                const bodyText = document.body?.innerText || '';
-                return {
-                    hasSettingUp: bodyText.toLowerCase().includes('setting up'),
-                    hasTopics: bodyText.toLowerCase().includes('topics'),
-                    hasAnalyzing: bodyText.toLowerCase().includes('analyzing'),
-                    hasLoading: bodyText.toLowerCase().includes('loading'),
-                    hasPrompts: bodyText.toLowerCase().includes('prompts'),
-                    hasConfirm: bodyText.toLowerCase().includes('confirm'),
-                    visibleButtons: Array.from(document.querySelectorAll('button'))
-                        .filter(b => b.offsetParent !== null)
-                        .map(b => b.textContent?.trim()?.slice(0, 50))
-                        .filter(t => t && t.length > 0)
-                        .slice(0, 10)
-                };
-            }
-        """)
-
-        logger.info(f"  [6.3] Modal state: settingUp={page_state.get('hasSettingUp')}, "
-                   f"topics={page_state.get('hasTopics')}, prompts={page_state.get('hasPrompts')}, "
+        hits = set(page_state.get("hits", ()))
+        logger.info(f"  [6.3] Modal state: settingUp={'setting up' in hits}, "
+                   f"topics={'topics' in hits}, prompts={'prompts' in hits}, "
                    f"buttons={page_state.get('visibleButtons', [])}")
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_06_workspace_details", duration)
         logger.info(f"  ✓ STEP 6 COMPLETED in {duration:.2f}s")
 
@@ -522,48 +601,63 @@ class CanaryTest:
 
         We wait for prompts to appear (up to 1 minute as per user guidance).
         """
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 7: WAIT FOR CATEGORIES & PROMPTS IN MODAL")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
 
-        # Poll DB for categories and workspace status
+        if await self._is_completed():
+            logger.info("  Fast path: workspace already COMPLETED")
+            self.metrics.record_step_timing("step_07_wait_categories", perf_counter() - start)
+            return
+
+        # Wait for workspace status via NOTIFY, polling the DB if unavailable
         timeout = self.config.CATEGORY_WAIT_TIMEOUT  # 2 minutes
         waited = 0
         categories_ready = False
 
-        while waited < timeout:
-            # Check categories
-            categories_result = self.db_verifier.verify_categories_created(
-                min_count=self.config.MIN_CATEGORIES_COUNT
+        try:
+            notified = await self.db_verifier.wait_for_status(
+                {"INTER_STEP_1_READY", "INTER_STEP_2_READY", "COMPLETED"}, timeout
             )
-            if categories_result.success and not categories_ready:
-                logger.info(f"  [7.1] Categories created: {categories_result.data}")
+        except asyncio.TimeoutError:
+            notified, waited = None, timeout
+        if notified:
+            logger.info(f"  [7.1] Workspace reached {notified}")
+        reached = notified
+
+        next_log = 0
+        delays = poll_delays(self.config.POLLING_INTERVAL)
+        while notified is None and waited < timeout:
+            # Status and counts in one query per tick
+            snap = await self._db(self.db_verifier.get_workspace_snapshot)
+            status = snap["status"] if snap else None
+
+            # Check categories
+            if snap and snap["categories_count"] >= self.config.MIN_CATEGORIES_COUNT and not categories_ready:
+                logger.info(f"  [7.1] Categories created: {snap['categories_count']}")
                 categories_ready = True
 
             # Check workspace status - accept any state that means we can proceed
-            status_inter1 = self.db_verifier.verify_workspace_status("INTER_STEP_1_READY")
-            status_inter2 = self.db_verifier.verify_workspace_status("INTER_STEP_2_READY")
-            status_completed = self.db_verifier.verify_workspace_status("COMPLETED")
-
-            if status_inter1.success:
+            if status in ("INTER_STEP_1_READY", "INTER_STEP_2_READY", "COMPLETED"):
+                reached = status
+            if status == "INTER_STEP_1_READY":
                 logger.info("  [7.1] Workspace reached INTER_STEP_1_READY")
                 break
-            elif status_inter2.success:
+            elif status == "INTER_STEP_2_READY":
                 logger.info("  [7.1] Workspace already at INTER_STEP_2_READY (fast path)")
                 break
-            elif status_completed.success:
+            elif status == "COMPLETED":
                 logger.info("  [7.1] Workspace already COMPLETED!")
                 break
 
-            if waited % 10 == 0:
-                ws = self.db_verifier.refresh_workspace()
-                if ws:
-                    cats = self.db_verifier.get_categories_count(ws['id'])
-                    logger.info(f"  [7.1] ... waiting ({waited}s), status={ws['status']}, categories={cats}")
+            if snap and waited >= next_log:
+                logger.info(f"  [7.1] ... waiting ({waited:.0f}s), status={status}, categories={snap['categories_count']}")
+                next_log += PROGRESS_LOG_INTERVAL
 
-            await asyncio.sleep(self.config.POLLING_INTERVAL)
-            waited += self.config.POLLING_INTERVAL
+            delay = next(delays)
+            await asyncio.sleep(delay)
+            waited += delay
 
         if waited >= timeout:
             raise CanaryTestError(
@@ -575,304 +669,295 @@ class CanaryTest:
         # Now wait for prompts to appear (up to 1 minute as per user)
         logger.info("  [7.2] Waiting for prompts to be generated...")
         prompts_timeout = 60
-        prompts_waited = 0
 
-        while prompts_waited < prompts_timeout:
-            prompts_result = self.db_verifier.verify_prompts_created(
-                min_count=self.config.MIN_PROMPTS_COUNT
-            )
-            if prompts_result.success:
-                self.prompts_ready_time = time.time()  # LOADING 1 END
-                loading_1_duration = self.prompts_ready_time - self.form_submitted_time if self.form_submitted_time else 0
-                logger.info(f"  [7.2] Prompts ready: {prompts_result.data}")
-                logger.info(f"  [7.2] ✅ LOADING 1 COMPLETED: {loading_1_duration:.1f}s (Form → Prompts)")
-                self.metrics.record_step_timing("loading_1_form_to_prompts", loading_1_duration)
-                break
+        if reached in ("INTER_STEP_2_READY", "COMPLETED"):
+            # Prompts are generated before INTER_STEP_2_READY; nothing to wait for
+            source, prompts = "status", None
+        else:
+            # Race the DB against the prompts modal; whichever confirms first wins
+            source, prompts = await first_completed({
+                "db": asyncio.wait_for(self._poll_db_for_prompts("7.2"), prompts_timeout),
+                "browser": self.browser.wait_for_prompts_modal(timeout_seconds=prompts_timeout),
+            })
+        if source:
+            self.prompts_ready_time = perf_counter()  # LOADING 1 END
+            loading_1_duration = self.prompts_ready_time - self.form_submitted_time if self.form_submitted_time else 0
+            if source == "db":
+                logger.info(f"  [7.2] Prompts ready: {prompts}")
+            elif source == "status":
+                logger.info(f"  [7.2] Prompts ready (workspace already {reached})")
+            else:
+                logger.info("  [7.2] Prompts modal visible")
+            logger.info(f"  [7.2] ✅ LOADING 1 COMPLETED: {loading_1_duration:.1f}s (Form → Prompts)")
+            self.metrics.record_step_timing("loading_1_form_to_prompts", loading_1_duration)
 
-            if prompts_waited % 10 == 0:
-                ws = self.db_verifier.refresh_workspace()
-                if ws:
-                    prompts = self.db_verifier.get_prompts_count(ws['id'])
-                    logger.info(f"  [7.2] ... waiting ({prompts_waited}s), prompts={prompts}")
+        # Check page state - should see "Workspace Prompts" modal or "Confirm Prompts" button
+        await self.browser.wait_for_dom_ready()
 
-            await asyncio.sleep(self.config.POLLING_INTERVAL)
-            prompts_waited += self.config.POLLING_INTERVAL
+        page_state = await self.browser.probe_modal_state("workspace prompts|confirm prompts")
 
-        # Check page state - should see "Workspace Prompts" modal or "Confirm Prompts" button
-        await asyncio.sleep(2)
-
-        page_state = await self.browser.page.evaluate("""
-            () => {
-                const bodyText = document.body?.innerText || '';
-                return {
-                    hasWorkspacePrompts: bodyText.toLowerCase().includes('workspace prompts'),
-                    hasConfirmPrompts: bodyText.toLowerCase().includes('confirm prompts'),
-                    hasPromptsList: !!document.querySelector('[class*="prompt"]'),
-                    visibleButtons: Array.from(document.querySelectorAll('button'))
-                        .filter(b => b.offsetParent !== null)
-                        .map(b => b.textContent?.trim()?.slice(0, 50))
-                        .filter(t => t && t.length > 0)
-                        .slice(0, 10)
-                };
-            }
-        """)
-
-        logger.info(f"  [7.3] Page state: workspacePrompts={page_state.get('hasWorkspacePrompts')}, "
-                   f"confirmBtn={page_state.get('hasConfirmPrompts')}, "
+        hits = set(page_state.get("hits", ()))
+        logger.info(f"  [7.3] Page state: workspacePrompts={'workspace prompts' in hits}, "
+                   f"confirmBtn={'confirm prompts' in hits}, "
                    f"buttons={page_state.get('visibleButtons', [])}")
 
         # Take screenshot
         screenshot_path = f"/tmp/canary_prompts_modal_{self.test_id}.png"
-        await self.browser.take_screenshot(screenshot_path)
+        self.browser.queue_screenshot(screenshot_path)
         logger.info(f"  [7.3] Screenshot: {screenshot_path}")
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_07_wait_categories", duration)
         logger.info(f"  ✓ STEP 7 COMPLETED in {duration:.2f}s")
 
     async def _step_08_approve_prompts(self) -> None:
         """Step 8: Wait for prompts generation and approve them."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 8: WAIT FOR PROMPTS & APPROVE")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
+
+        if await self._is_completed():
+            logger.info("  Fast path: workspace already COMPLETED")
+            self.metrics.record_step_timing("step_08_approve_prompts", perf_counter() - start)
+            return
 
-        current_url = await self.browser.get_current_url()
+        current_url = self.browser.url
         logger.info(f"  [8.1] Current URL: {current_url}")
 
         # Wait for prompts to be generated in DB
         logger.info("  [8.2] Waiting for prompts generation...")
         timeout = self.config.CATEGORY_WAIT_TIMEOUT
-        waited = 0
-        prompts_ready = False
-
-        while waited < timeout:
-            prompts_result = self.db_verifier.verify_prompts_created(
-                min_count=self.config.MIN_PROMPTS_COUNT
-            )
-            if prompts_result.success:
-                logger.info(f"  [8.2] Prompts ready: {prompts_result.data}")
-                prompts_ready = True
-                break
-
-            # Also check workspace status
-            ws = self.db_verifier.refresh_workspace()
-            if ws:
-                logger.info(f"  [8.2] ... waiting ({waited}s), status={ws['status']}, prompts={self.db_verifier.get_prompts_count(ws['id'])}")
-
-            await asyncio.sleep(self.config.POLLING_INTERVAL)
-            waited += self.config.POLLING_INTERVAL
 
-        if not prompts_ready:
+        source, prompts = await first_completed({
+            "db": asyncio.wait_for(self._poll_db_for_prompts("8.2"), timeout),
+            "browser": self.browser.wait_for_prompts_modal(timeout_seconds=timeout),
+        })
+        if source == "db":
+            logger.info(f"  [8.2] Prompts ready: {prompts}")
+        elif source:
+            logger.info("  [8.2] Prompts modal visible")
+        else:
             logger.warning(f"  [8.2] Prompts not ready after {timeout}s")
 
         # Take screenshot of prompts page
         screenshot_path = f"/tmp/canary_prompts_{self.test_id}.png"
-        await self.browser.take_screenshot(screenshot_path)
+        self.browser.queue_screenshot(screenshot_path)
         logger.info(f"  [8.3] Prompts page screenshot: {screenshot_path}")
 
         # Click continue/approve button to confirm prompts
         logger.info("  [8.4] Looking for approve/continue button...")
         try:
             await self.browser.click_continue_prompts()
-            self.prompts_confirmed_time = time.time()  # LOADING 2 START
+            self.prompts_confirmed_time = perf_counter()  # LOADING 2 START
             logger.info("  [8.4] Clicked approve button - prompts confirmed")
             logger.info(f"  [8.4] 🚀 LOADING 2 STARTED (prompts confirmed)")
         except CanaryTestError:
             logger.info("  [8.4] No approve button found")
 
-        await asyncio.sleep(3)
+        await self.browser.wait_for_ready_state()
 
         # Wait for INTER_STEP_2_READY status
         logger.info("  [8.5] Waiting for workspace to reach INTER_STEP_2_READY...")
         timeout = 90
         waited = 0
-        while waited < timeout:
-            status_result = self.db_verifier.verify_workspace_status("INTER_STEP_2_READY")
-            status_completed = self.db_verifier.verify_workspace_status("COMPLETED")
-
-            if status_completed.success:
+        try:
+            notified = await self.db_verifier.wait_for_status(
+                {"INTER_STEP_2_READY", "COMPLETED"}, timeout
+            )
+        except asyncio.TimeoutError:
+            notified, waited = None, timeout
+        if notified:
+            logger.info(f"  [8.5] Workspace reached {notified}")
+
+        next_log = 0
+        delays = poll_delays(self.config.POLLING_INTERVAL)
+        while notified is None and waited < timeout:
+            snap = await self._db(self.db_verifier.get_workspace_snapshot)
+            status = snap["status"] if snap else None
+
+            if status == "COMPLETED":
                 logger.info("  [8.5] Workspace is COMPLETED")
                 break
-            elif status_result.success:
+            elif status == "INTER_STEP_2_READY":
                 logger.info("  [8.5] Workspace reached INTER_STEP_2_READY")
                 break
 
-            ws = self.db_verifier.refresh_workspace()
-            if ws:
-                logger.info(f"  [8.5] ... waiting ({waited}s), status={ws['status']}")
+            if snap and waited >= next_log:
+                logger.info(f"  [8.5] ... waiting ({waited:.0f}s), status={status}")
+                next_log += PROGRESS_LOG_INTERVAL
 
-            await asyncio.sleep(self.config.POLLING_INTERVAL)
-            waited += self.config.POLLING_INTERVAL
+            delay = next(delays)
+            await asyncio.sleep(delay)
+            waited += delay
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_08_approve_prompts", duration)
         logger.info(f"  ✓ STEP 8 COMPLETED in {duration:.2f}s")
 
     async def _step_09_wait_for_snapshot(self) -> None:
         """Step 9: Wait for snapshot to complete and workspace to reach COMPLETED."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 9: WAIT FOR SNAPSHOT & WORKSPACE COMPLETED")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
+
+        if await self._is_completed():
+            logger.info("  Fast path: workspace already COMPLETED")
+            self.metrics.record_step_timing("step_09_wait_snapshot", perf_counter() - start)
+            return
 
-        current_url = await self.browser.get_current_url()
+        current_url = self.browser.url
         logger.info(f"  [9.1] Current URL: {current_url}")
 
-        # Try browser wait but don't fail if it times out
+        # Check browser state alongside the DB poll; don't fail if it times out
         logger.info("  [9.2] Checking browser state...")
-        try:
-            await self.browser.wait_for_snapshot_loading(timeout_seconds=10)
-        except CanaryTestError:
-            logger.info("  [9.2] Browser wait completed (no snapshot loading UI detected)")
-
-        # Poll DB for snapshot COMPLETED status
-        timeout = self.config.SNAPSHOT_WAIT_TIMEOUT
-        waited = 0
-        snapshot_completed = False
-
-        while waited < timeout:
-            workspace = self.db_verifier.refresh_workspace()
-            if not workspace:
-                await asyncio.sleep(self.config.POLLING_INTERVAL)
-                waited += self.config.POLLING_INTERVAL
-                continue
-
-            snapshot = self.db_verifier.get_latest_snapshot(workspace["id"])
-
-            if snapshot:
-                snap_status = snapshot.get("status", "UNKNOWN")
-                if snap_status == "COMPLETED":
-                    logger.info(f"  [9.2] Snapshot COMPLETED (ID={snapshot['id']})")
-                    snapshot_completed = True
-                    break
-                elif snap_status == "FAILED":
-                    logger.error(f"  [9.2] Snapshot FAILED (ID={snapshot['id']})")
-                    break
-                else:
-                    # Get snapshot prompts progress
-                    prompts_status = self.db_verifier.get_snapshot_prompts_status(snapshot["id"])
-                    total = prompts_status.get("total", 0)
-                    completed = prompts_status.get("completed", 0)
-                    logger.info(f"  [9.2] ... snapshot {snap_status}, prompts {completed}/{total} ({waited}s)")
-            else:
-                logger.info(f"  [9.2] ... waiting for snapshot ({waited}s)")
-
-            await asyncio.sleep(self.config.POLLING_INTERVAL)
-            waited += self.config.POLLING_INTERVAL
-
-        if not snapshot_completed and waited >= timeout:
-            logger.warning(f"  [9.2] Snapshot not completed after {timeout}s")
-
-        # Now wait for workspace COMPLETED status
-        logger.info("  [9.3] Waiting for workspace COMPLETED status...")
-        timeout = 120
-        waited = 0
+        ui_check = asyncio.create_task(self.browser.wait_for_snapshot_loading(timeout_seconds=10))
+
+        # One wait for both transitions: the snapshot settles, then the
+        # workspace is marked COMPLETED. A FAILED snapshot ends it early.
+        timeout = self.config.SNAPSHOT_WAIT_TIMEOUT + WORKSPACE_COMPLETED_TIMEOUT
+        wait_start = perf_counter()
+        deadline = wait_start + timeout
+        workspace = snapshot = None
         workspace_completed = False
 
-        while waited < timeout:
-            status_result = self.db_verifier.verify_workspace_status("COMPLETED")
-            if status_result.success:
-                self.dashboard_ready_time = time.time()  # LOADING 2 END
-                loading_2_duration = self.dashboard_ready_time - self.prompts_confirmed_time if self.prompts_confirmed_time else 0
-                logger.info("  [9.3] Workspace is COMPLETED!")
-                logger.info(f"  [9.3] ✅ LOADING 2 COMPLETED: {loading_2_duration:.1f}s (Confirm → Dashboard)")
-                self.metrics.record_step_timing("loading_2_confirm_to_dashboard", loading_2_duration)
-                workspace_completed = True
-                break
-
-            ws = self.db_verifier.refresh_workspace()
-            if ws:
-                logger.info(f"  [9.3] ... workspace status: {ws['status']} ({waited}s)")
-
-            await asyncio.sleep(self.config.POLLING_INTERVAL)
-            waited += self.config.POLLING_INTERVAL
-
-        if not workspace_completed:
-            ws = self.db_verifier.refresh_workspace()
-            final_status = ws["status"] if ws else "UNKNOWN"
-            logger.warning(f"  [9.3] Workspace not COMPLETED after {timeout}s, final status: {final_status}")
+        next_log = 0
+        last_progress = last_state = None
+        delays = poll_delays(self.config.POLLING_INTERVAL)
+        try:
+            # Sleep until one of those happens if NOTIFY is available; the
+            # first poll below then confirms it
+            try:
+                await self.db_verifier.wait_for_completion(timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            while True:
+                waited = perf_counter() - wait_start
+                delay = min(next(delays), max(deadline - perf_counter(), 0))
+                log_due = waited >= next_log
+                if log_due:
+                    next_log += PROGRESS_LOG_INTERVAL
+
+                # The interval runs while the queries do, so each round takes
+                # max(query, delay) rather than their sum
+                tick = asyncio.create_task(asyncio.sleep(delay))
+                try:
+                    workspace = await self.db_verifier.refresh_workspace_async()
+                    snapshot_settled = bool(snapshot) and snapshot["status"] in _SNAPSHOT_SETTLED
+                    if workspace and not snapshot_settled:
+                        snapshot = await self.db_verifier.get_latest_snapshot_async(workspace["id"])
+                        if snapshot and snapshot["status"] == "COMPLETED":
+                            logger.info(f"  [9.2] Snapshot COMPLETED (ID={snapshot['id']})")
+                            self._final_snapshot_row = snapshot
+                        elif snapshot and snapshot["status"] == "FAILED":
+                            logger.error(f"  [9.2] Snapshot FAILED (ID={snapshot['id']})")
+                            self._final_snapshot_row = snapshot
+
+                    if workspace and workspace["status"] == "COMPLETED":
+                        workspace_completed = True
+                        self._final_workspace_row = workspace
+                        break
+                    if (snapshot and snapshot["status"] == "FAILED") or perf_counter() >= deadline:
+                        break
+
+                    # Any status change means the pipeline is moving: poll
+                    # fast again instead of staying at the backoff cap
+                    state = (workspace and workspace["status"], snapshot and snapshot["status"])
+                    if state != last_state:
+                        if last_state is not None:
+                            delays = poll_delays(self.config.POLLING_INTERVAL)
+                        last_state = state
+
+                    if log_due and workspace:
+                        # Only log progress when it moved
+                        if not snapshot:
+                            progress = ("waiting",)
+                        elif snapshot["status"] in _SNAPSHOT_SETTLED:
+                            progress = ("workspace", workspace["status"])
+                        else:
+                            prompts_status = await self.db_verifier.get_snapshot_prompts_status_async(snapshot["id"])
+                            progress = ("snapshot", snapshot["status"], prompts_status["completed"], prompts_status["total"])
+
+                        if progress != last_progress:
+                            if last_progress is not None and progress[0] == last_progress[0] == "snapshot":
+                                # Prompts completed since the last check
+                                delays = poll_delays(self.config.POLLING_INTERVAL)
+                            last_progress = progress
+                            if progress[0] == "waiting":
+                                logger.info("  [9.2] ... waiting for snapshot (%.0fs)", waited)
+                            elif progress[0] == "workspace":
+                                logger.info("  [9.3] ... workspace status: %s (%.0fs)", progress[1], waited)
+                            else:
+                                logger.info("  [9.2] ... snapshot %s, prompts %d/%d (%.0fs)", *progress[1:], waited)
+
+                    await tick
+                finally:
+                    tick.cancel()
+        finally:
+            try:
+                await ui_check
+            except CanaryTestError:
+                logger.info("  [9.2] Browser wait completed (no snapshot loading UI detected)")
+
+        if workspace_completed:
+            self.dashboard_ready_time = perf_counter()  # LOADING 2 END
+            loading_2_duration = self.dashboard_ready_time - self.prompts_confirmed_time if self.prompts_confirmed_time else 0
+            logger.info("  [9.3] Workspace is COMPLETED!")
+            logger.info(f"  [9.3] ✅ LOADING 2 COMPLETED: {loading_2_duration:.1f}s (Confirm → Dashboard)")
+            self.metrics.record_step_timing("loading_2_confirm_to_dashboard", loading_2_duration)
+        else:
+            if not snapshot or snapshot["status"] not in _SNAPSHOT_SETTLED:
+                logger.warning(f"  [9.2] Snapshot not completed after {timeout}s")
+            final_status = workspace["status"] if workspace else "UNKNOWN"
+            logger.warning(f"  [9.3] Workspace not COMPLETED after {perf_counter() - wait_start:.0f}s, final status: {final_status}")
 
         # Calculate snapshot processing time (from prompts confirmation)
-        if hasattr(self, 'prompts_confirmed_time'):
-            snapshot_time = time.time() - self.prompts_confirmed_time
+        if self.prompts_confirmed_time is not None:
+            snapshot_time = perf_counter() - self.prompts_confirmed_time
             logger.info(f"  [9.4] Snapshot processing took {snapshot_time:.1f}s from prompts confirmation")
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_09_wait_snapshot", duration)
         logger.info(f"  ✓ STEP 9 COMPLETED in {duration:.2f}s")
 
     async def _step_10_verify_dashboard(self) -> None:
         """Step 10: Verify dashboard loaded and collect UI data."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 10: VERIFY DASHBOARD & COLLECT UI DATA")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
 
         # Try to get workspace ULID from URL
         if not self.workspace_ulid:
             self.workspace_ulid = await self.browser.get_workspace_ulid_from_url()
 
-        current_url = await self.browser.get_current_url()
+        current_url = self.browser.url
         logger.info(f"  [10.1] Current URL: {current_url}")
 
         # Navigate to overview if not there
         if "/overview" not in current_url and self.workspace_ulid:
             overview_url = f"{self.config.BASE_URL}/workspace/{self.workspace_ulid}/overview"
             logger.info(f"  [10.2] Navigating to overview: {overview_url}")
-            await self.browser.page.goto(overview_url, wait_until="load", timeout=30000)
+            await self.browser.page.goto(overview_url, wait_until="domcontentloaded", timeout=30000)
             await asyncio.sleep(3)
 
-        # Verify dashboard loaded
-        dashboard_ok = await self.browser.verify_dashboard_loaded()
+        # Dashboard check, UI data, workspace refresh and the final screenshot
+        # don't depend on each other; run them together and let each fail alone
+        screenshot_path = f"/tmp/canary_dashboard_{self.test_id}.png"
+        dashboard_ok, ui_data, workspace, _ = await asyncio.gather(
+            self.browser.verify_dashboard_loaded(),
+            self.browser.collect_ui_data(),
+            self._current_workspace(),
+            self.browser.take_screenshot(screenshot_path),
+            return_exceptions=True
+        )
+
         logger.info(f"  [10.3] Dashboard loaded: {dashboard_ok}")
 
-        # Collect UI data from the page
-        ui_data = await self.browser.page.evaluate("""
-            () => {
-                const data = {
-                    dashboard_loaded: false,
-                    charts_visible: false,
-                    current_url: window.location.href,
-                    page_title: document.title,
-                    sections: [],
-                    metrics: {}
-                };
-
-                // Check for dashboard elements
-                const mainContent = document.querySelector('main') || document.body;
-                if (mainContent) {
-                    data.dashboard_loaded = true;
-                }
-
-                // Check for charts
-                const charts = document.querySelectorAll('[class*="chart"], canvas, svg');
-                data.charts_visible = charts.length > 0;
-                data.metrics.charts_count = charts.length;
-
-                // Check for sidebar navigation
-                const sidebar = document.querySelector('aside, nav, [class*="sidebar"]');
-                if (sidebar) {
-                    const navLinks = sidebar.querySelectorAll('a');
-                    data.sections = Array.from(navLinks).map(a => a.textContent.trim()).filter(t => t.length > 0 && t.length < 30).slice(0, 10);
-                }
-
-                // Check for data elements
-                const cards = document.querySelectorAll('[class*="card"]');
-                data.metrics.cards_count = cards.length;
-
-                // Check for brand name display
-                const brandEl = document.querySelector('h1, [class*="brand"], [class*="title"]');
-                if (brandEl) {
-                    data.brand_name = brandEl.textContent.trim().slice(0, 50);
-                }
-
-                // Body text preview
-                data.body_preview = document.body?.innerText?.slice(0, 500) || '';
-
-                return data;
-            }
-        """)
+        if isinstance(ui_data, Exception):
+            raise ui_data
 
         logger.info(f"  [10.4] UI Data collected:")
         logger.info(f"        - Dashboard loaded: {ui_data.get('dashboard_loaded')}")
@@ -884,67 +969,82 @@ class CanaryTest:
         self.metrics.set_ui_data(ui_data)
 
         # Check workspace status
-        workspace = self.db_verifier.refresh_workspace()
-        if workspace:
+        if isinstance(workspace, Exception):
+            logger.warning(f"  [10.5] Workspace refresh failed: {workspace}")
+        elif workspace:
             logger.info(f"  [10.5] Workspace status: {workspace.get('status')}")
 
-        # Take final screenshot
-        screenshot_path = f"/tmp/canary_dashboard_{self.test_id}.png"
-        await self.browser.take_screenshot(screenshot_path)
         logger.info(f"  [10.6] Dashboard screenshot: {screenshot_path}")
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_10_verify_dashboard", duration)
         logger.info(f"  ✓ STEP 10 COMPLETED in {duration:.2f}s")
 
     async def _step_11_full_verification(self) -> None:
         """Step 11: Full verification and comprehensive data collection."""
-        start = time.time()
-        logger.info("=" * 60)
+        start = perf_counter()
+        logger.info(self._BANNER)
         logger.info("STEP 11: FULL VERIFICATION & DATA COLLECTION")
-        logger.info("=" * 60)
-
-        # Get full verification results
-        verification = self.db_verifier.full_verification()
-
-        logger.info("  [11.1] Verification Results:")
-        for key, val in verification.get("results", {}).items():
-            if val:
-                status = "✓" if val.get("success") else "✗"
-                logger.info(f"        {status} {key}: {val.get('message', 'N/A')}")
-
-        # Get comprehensive DB data for reporting
-        logger.info("  [11.2] Collecting comprehensive DB data...")
-        comprehensive_data = self.db_verifier.get_comprehensive_data()
-
-        logger.info(f"        - Workspace: {comprehensive_data.get('workspace', {}).get('ulid', 'N/A')}")
-        logger.info(f"        - Status: {comprehensive_data.get('workspace', {}).get('status', 'N/A')}")
-        logger.info(f"        - Categories: {comprehensive_data.get('categories_count', 0)}")
-        logger.info(f"        - Prompts: {comprehensive_data.get('prompts_count', 0)}")
-        logger.info(f"        - Competitors: {comprehensive_data.get('competitors_count', 0)}")
-
-        if comprehensive_data.get('snapshot'):
-            logger.info(f"        - Snapshot: {comprehensive_data['snapshot'].get('status', 'N/A')}")
-            if comprehensive_data.get('snapshot_prompts_status'):
-                sps = comprehensive_data['snapshot_prompts_status']
-                logger.info(f"        - Snapshot Prompts: {sps.get('completed', 0)}/{sps.get('total', 0)} completed")
-
-        # Log some actual data for debugging
-        if comprehensive_data.get('categories_list'):
-            logger.info("        Categories:")
-            for cat in comprehensive_data['categories_list'][:5]:
-                logger.info(f"          • {cat.get('name', 'N/A')}")
-
-        if comprehensive_data.get('prompts_list'):
-            logger.info("        Top Prompts:")
-            for prompt in comprehensive_data['prompts_list'][:5]:
-                tracked = "📍" if prompt.get('is_tracked') else ""
-                logger.info(f"          • {prompt.get('name', 'N/A')[:50]} {tracked}")
-
-        if comprehensive_data.get('competitors_list'):
-            logger.info("        Competitors:")
-            for comp in comprehensive_data['competitors_list'][:5]:
-                logger.info(f"          • {comp.get('name', 'N/A')} ({comp.get('domain', 'N/A')})")
+        logger.info(self._BANNER)
+
+        # One query for the whole report; full_verification reuses its counts.
+        # Both run on a single read-only connection
+        def collect():
+            with self.db_verifier:
+                data = self.db_verifier.get_comprehensive_data_batched()
+                return data, self.db_verifier.full_verification(
+                    workspace=self._final_workspace_row,
+                    snapshot=self._final_snapshot_row,
+                    data=data
+                )
+
+        comprehensive_data, verification = await self._db(collect)
+
+        # One multi-line record per section instead of a call per line
+        if logger.isEnabledFor(logging.INFO):
+            lines = ["  [11.1] Verification Results:"]
+            lines += [
+                f"        {'✓' if val.get('success') else '✗'} {key}: {val.get('message', 'N/A')}"
+                for key, val in verification.get("results", {}).items() if val
+            ]
+            logger.info("\n".join(lines))
+
+            workspace = comprehensive_data.get('workspace') or {}
+            lines = [
+                "  [11.2] Comprehensive DB data:",
+                f"        - Workspace: {workspace.get('ulid', 'N/A')}",
+                f"        - Status: {workspace.get('status', 'N/A')}",
+                f"        - Categories: {comprehensive_data.get('categories_count', 0)}",
+                f"        - Prompts: {comprehensive_data.get('prompts_count', 0)}",
+                f"        - Competitors: {comprehensive_data.get('competitors_count', 0)}"
+            ]
+
+            if comprehensive_data.get('snapshot'):
+                lines.append(f"        - Snapshot: {comprehensive_data['snapshot'].get('status', 'N/A')}")
+                if comprehensive_data.get('snapshot_prompts_status'):
+                    sps = comprehensive_data['snapshot_prompts_status']
+                    lines.append(f"        - Snapshot Prompts: {sps.get('completed', 0)}/{sps.get('total', 0)} completed")
+
+            # Log some actual data for debugging
+            if comprehensive_data.get('categories_list'):
+                lines.append("        Categories:")
+                lines += [f"          • {cat.get('name', 'N/A')}" for cat in comprehensive_data['categories_list'][:5]]
+
+            if comprehensive_data.get('prompts_list'):
+                lines.append("        Top Prompts:")
+                lines += [
+                    f"          • {prompt.get('name', 'N/A')[:50]} {'📍' if prompt.get('is_tracked') else ''}"
+                    for prompt in comprehensive_data['prompts_list'][:5]
+                ]
+
+            if comprehensive_data.get('competitors_list'):
+                lines.append("        Competitors:")
+                lines += [
+                    f"          • {comp.get('name', 'N/A')} ({comp.get('domain', 'N/A')})"
+                    for comp in comprehensive_data['competitors_list'][:5]
+                ]
+
+            logger.info("\n".join(lines))
 
         # Store DB data for reporting
         self.metrics.set_db_data(comprehensive_data)
@@ -963,12 +1063,12 @@ class CanaryTest:
             ]
             logger.info(f"  [11.3] ⚠️ Some checks not fully met: {failed_checks}")
 
-        duration = time.time() - start
+        duration = perf_counter() - start
         self.metrics.record_step_timing("step_11_full_verification", duration)
         logger.info(f"  ✓ STEP 11 COMPLETED in {duration:.2f}s")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
         logger.info("CANARY TEST COMPLETE")
-        logger.info("=" * 60)
+        logger.info(self._BANNER)
 
 
 async def run_canary_test(database_url: Optional[str] = None) -> CanaryResult:
@@ -994,7 +1094,16 @@ def run_canary_test_sync() -> CanaryResult:
     Returns:
         CanaryResult with test outcome
     """
-    return asyncio.run(run_canary_test())
+    return run_on_fast_loop(_run_and_shutdown())
+
+
+async def _run_and_shutdown() -> CanaryResult:
+    """Run one canary test and release the shared browser and engine before the loop closes."""
+    try:
+        return await run_canary_test()
+    finally:
+        await BrowserAutomation.shutdown_shared()
+        DBVerifier.dispose_shared_engine()
 
 
 if __name__ == "__main__":
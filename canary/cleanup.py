@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List, TYPE_CHECKING
+from sqlalchemy import func, update
 from sqlmodel import Session, select, not_
 
 from canary.config import get_canary_config
@@ -31,6 +32,15 @@ def _get_models():
     return User, Workspace
 
 
+def _is_canary_row(model, domain: str):
+    """lower(email) LIKE '%@<domain>' for model's table.
+
+    Kept as one literal pattern so the partial indexes in
+    sql/canary_cleanup_indexes.sql can serve it.
+    """
+    return func.lower(model.email).like(f"%@{domain.lower()}")
+
+
 class CanaryCleanup:
     """
     Cleanup handler for canary test data.
@@ -42,6 +52,7 @@ class CanaryCleanup:
     def __init__(self, session: Session):
         self.session = session
         self.config = get_canary_config()
+        self._canary_suffix = "@" + self.config.EMAIL_DOMAIN.lower()
 
     def cleanup_workspace(self, workspace_id: int) -> bool:
         """
@@ -103,7 +114,7 @@ class CanaryCleanup:
 
             user = self.session.exec(
                 select(User)
-                .where(User.email.ilike(user_email))
+                .where(func.lower(User.email) == user_email.lower())
                 .where(not_(User.is_deleted))
             ).first()
 
@@ -139,7 +150,9 @@ class CanaryCleanup:
         if hours is None:
             hours = self.config.CLEANUP_AFTER_HOURS
 
-        cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
+        # One timestamp for the batch: the cutoff and every deleted_at
+        now = datetime.now(timezone.utc)
+        cutoff_time = now - timedelta(hours=hours)
 
         stats = {
             "workspaces_cleaned": 0,
@@ -149,39 +162,29 @@ class CanaryCleanup:
 
         User, Workspace = _get_models()
         try:
-            # Find old canary workspaces
-            old_workspaces = self.session.exec(
-                select(Workspace)
-                .where(Workspace.email.like(f"%@{self.config.EMAIL_DOMAIN}"))
+            domain = self.config.EMAIL_DOMAIN
+
+            # Soft delete old canary workspaces in one statement
+            workspace_ids = self.session.execute(
+                update(Workspace)
+                .where(_is_canary_row(Workspace, domain))
                 .where(Workspace.created_at < cutoff_time)
                 .where(not_(Workspace.is_deleted))
-            ).all()
-
-            for workspace in old_workspaces:
-                try:
-                    workspace.is_deleted = True
-                    workspace.deleted_at = datetime.now(timezone.utc)
-                    self.session.add(workspace)
-                    stats["workspaces_cleaned"] += 1
-                except Exception as e:
-                    stats["errors"].append(f"Workspace {workspace.id}: {str(e)}")
-
-            # Find old canary users
-            old_users = self.session.exec(
-                select(User)
-                .where(User.email.like(f"%@{self.config.EMAIL_DOMAIN}"))
+                .values(is_deleted=True, deleted_at=now)
+                .returning(Workspace.id)
+            ).scalars().all()
+            stats["workspaces_cleaned"] = len(workspace_ids)
+
+            # Soft delete old canary users in one statement
+            user_ids = self.session.execute(
+                update(User)
+                .where(_is_canary_row(User, domain))
                 .where(User.created_at < cutoff_time)
                 .where(not_(User.is_deleted))
-            ).all()
-
-            for user in old_users:
-                try:
-                    user.is_deleted = True
-                    user.deleted_at = datetime.now(timezone.utc)
-                    self.session.add(user)
-                    stats["users_cleaned"] += 1
-                except Exception as e:
-                    stats["errors"].append(f"User {user.id}: {str(e)}")
+                .values(is_deleted=True, deleted_at=now)
+                .returning(User.id)
+            ).scalars().all()
+            stats["users_cleaned"] = len(user_ids)
 
             self.session.commit()
 
@@ -199,7 +202,7 @@ class CanaryCleanup:
 
     def _is_canary_email(self, email: str) -> bool:
         """Check if an email is a canary test email."""
-        return email.lower().endswith(f"@{self.config.EMAIL_DOMAIN.lower()}")
+        return email.lower().endswith(self._canary_suffix)
 
     def _is_canary_workspace(self, workspace: Workspace) -> bool:
         """Check if a workspace is a canary test workspace."""
@@ -217,8 +220,9 @@ class CanaryCleanup:
         Returns:
             List of canary workspaces
         """
+        User, Workspace = _get_models()
         query = select(Workspace).where(
-            Workspace.email.like(f"%@{self.config.EMAIL_DOMAIN}")
+            _is_canary_row(Workspace, self.config.EMAIL_DOMAIN)
         )
 
         if not include_deleted:
@@ -236,8 +240,9 @@ class CanaryCleanup:
         Returns:
             List of canary users
         """
+        User, Workspace = _get_models()
         query = select(User).where(
-            User.email.like(f"%@{self.config.EMAIL_DOMAIN}")
+            _is_canary_row(User, self.config.EMAIL_DOMAIN)
         )
 
         if not include_deleted:
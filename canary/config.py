@@ -6,11 +6,53 @@ the full customer journey from landing page to dashboard.
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any, Callable, Optional
 
 
-@dataclass
+@cache
+def _settings():
+    """Return the main app settings, or None when running standalone.
+
+    Resolved once; every settings-backed field default reads this.
+    """
+    try:
+        from app.shared.config import get_settings
+    except ImportError:
+        return None
+    return get_settings()
+
+
+def _parse(raw: str, default: Any) -> Any:
+    """Coerce an env string to the type of the field default."""
+    if isinstance(default, bool):
+        return raw.lower() == "true"
+    if isinstance(default, int):
+        return int(raw)
+    return raw
+
+
+def _env(name: str, default: Any) -> Callable[[], Any]:
+    """Default factory reading an environment variable."""
+    def factory():
+        raw = os.getenv(name)
+        return default if not raw else _parse(raw, default)
+    return factory
+
+
+def _setting(name: str, default: Any, env_fallback: bool = True) -> Callable[[], Any]:
+    """Default factory reading main settings first, then the environment."""
+    def factory():
+        settings = _settings()
+        if settings is not None:
+            value = getattr(settings, name, None)
+            return default if value is None or value == "" else value
+        return _env(name, default)() if env_fallback else default
+    return factory
+
+
+@dataclass(frozen=True, slots=True)
 class CanaryConfig:
     """Configuration for canary tests."""
 
@@ -25,13 +67,13 @@ class CanaryConfig:
     # Timeouts (in seconds)
     PAGE_LOAD_TIMEOUT: int = 30
     NAVIGATION_TIMEOUT: int = 60
-    CATEGORY_WAIT_TIMEOUT: int = 120  # 2 minutes
-    SNAPSHOT_WAIT_TIMEOUT: int = 300  # 5 minutes
+    CATEGORY_WAIT_TIMEOUT: int = field(default_factory=_setting("CANARY_CATEGORY_WAIT_TIMEOUT", 120))  # 2 minutes
+    SNAPSHOT_WAIT_TIMEOUT: int = field(default_factory=_setting("CANARY_SNAPSHOT_WAIT_TIMEOUT", 300))  # 5 minutes
     ELEMENT_WAIT_TIMEOUT: int = 10
     POLLING_INTERVAL: int = 5  # How often to poll for status changes
 
     # Browser settings
-    HEADLESS: bool = True
+    HEADLESS: bool = field(default_factory=_setting("CANARY_HEADLESS", True))
     BROWSER_VIEWPORT_WIDTH: int = 1920
     BROWSER_VIEWPORT_HEIGHT: int = 1080
     SLOW_MO: int = 0  # Milliseconds to slow down operations (useful for debugging)
@@ -42,60 +84,32 @@ class CanaryConfig:
 
     # Alerting
     ALERT_ON_FAILURE: bool = True
-    SLACK_WEBHOOK_URL: Optional[str] = None
+    SLACK_WEBHOOK_URL: Optional[str] = field(default_factory=_setting("CANARY_SLACK_WEBHOOK", None))
+    SENTRY_MEASUREMENTS: bool = field(default_factory=_env("CANARY_SENTRY_MEASUREMENTS", True))  # Send step durations as Sentry transaction measurements
 
     # Cleanup
-    AUTO_CLEANUP: bool = True
-    CLEANUP_AFTER_HOURS: int = 24
+    AUTO_CLEANUP: bool = field(default_factory=_setting("CANARY_AUTO_CLEANUP", True, env_fallback=False))
+    CLEANUP_AFTER_HOURS: int = field(default_factory=_setting("CANARY_CLEANUP_AFTER_HOURS", 24, env_fallback=False))
 
     # URLs
-    BASE_URL: str = "https://maxeo.ai"
+    BASE_URL: str = field(default_factory=_setting("CANARY_BASE_URL", "https://maxeo.ai"))
 
     # Development/Debug options
-    SKIP_OTP_VERIFICATION: bool = False  # Set to True for local dev testing
-    DEBUG_MODE: bool = False  # Enable extra logging
+    SKIP_OTP_VERIFICATION: bool = field(default_factory=_env("CANARY_SKIP_OTP", False))  # Set to True for local dev testing
+    DEBUG_MODE: bool = field(default_factory=_env("CANARY_DEBUG", False))  # Enable extra logging
 
     # Test data verification thresholds
     MIN_CATEGORIES_COUNT: int = 3
     MIN_PROMPTS_COUNT: int = 15
 
-    def __post_init__(self):
-        """Load values from environment variables or main settings if available."""
-        # Try to load from main settings first, then fall back to env vars
-        try:
-            # from app.shared.config import get_settings
-            settings = get_settings()
-
-            self.SLACK_WEBHOOK_URL = settings.CANARY_SLACK_WEBHOOK or self.SLACK_WEBHOOK_URL
-            self.BASE_URL = settings.CANARY_BASE_URL or self.BASE_URL
-            self.HEADLESS = settings.CANARY_HEADLESS
-            self.CATEGORY_WAIT_TIMEOUT = settings.CANARY_CATEGORY_WAIT_TIMEOUT
-            self.SNAPSHOT_WAIT_TIMEOUT = settings.CANARY_SNAPSHOT_WAIT_TIMEOUT
-            self.AUTO_CLEANUP = settings.CANARY_AUTO_CLEANUP
-            self.CLEANUP_AFTER_HOURS = settings.CANARY_CLEANUP_AFTER_HOURS
-        except Exception:
-            # Fall back to environment variables
-            self.SLACK_WEBHOOK_URL = os.getenv("CANARY_SLACK_WEBHOOK", self.SLACK_WEBHOOK_URL)
-            self.BASE_URL = os.getenv("CANARY_BASE_URL", self.BASE_URL)
-            self.HEADLESS = os.getenv("CANARY_HEADLESS", "true").lower() == "true"
-
-            if os.getenv("CANARY_CATEGORY_WAIT_TIMEOUT"):
-                self.CATEGORY_WAIT_TIMEOUT = int(os.getenv("CANARY_CATEGORY_WAIT_TIMEOUT"))
-            if os.getenv("CANARY_SNAPSHOT_WAIT_TIMEOUT"):
-                self.SNAPSHOT_WAIT_TIMEOUT = int(os.getenv("CANARY_SNAPSHOT_WAIT_TIMEOUT"))
-
-        # Development options from environment
-        self.SKIP_OTP_VERIFICATION = os.getenv("CANARY_SKIP_OTP", "false").lower() == "true"
-        self.DEBUG_MODE = os.getenv("CANARY_DEBUG", "false").lower() == "true"
-
-
-# Singleton instance
-_config: Optional[CanaryConfig] = None
-
 
+@cache
 def get_canary_config() -> CanaryConfig:
     """Get the canary configuration singleton."""
-    global _config
-    if _config is None:
-        _config = CanaryConfig()
-    return _config
+    return CanaryConfig()
+
+
+def invalidate_config_cache() -> None:
+    """Drop the cached config so the next call re-reads the environment."""
+    _settings.cache_clear()
+    get_canary_config.cache_clear()
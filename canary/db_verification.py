@@ -11,19 +11,237 @@ This makes it lightweight and independent of the main app's model structure.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, FrozenSet, Iterable, Iterator, Sequence, Tuple
+import pyotp
 from sqlalchemy import create_engine, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.sql.elements import TextClause
 
 from canary.utils import (
     get_canary_logger,
     decrypt_string,
-    generate_totp_token
+    generate_totp_token,
+    totp_window_start
 )
 
 logger = get_canary_logger("canary.db_verification")
 
+# Engine pool: one warm connection, a few more when steps race DB queries.
+# The engine is shared across runs in one process, so recycle connections
+# older than this and ping before reuse after idle gaps between runs
+POOL_SIZE = 1
+POOL_MAX_OVERFLOW = 3
+POOL_RECYCLE_SECONDS = 1800
+
+# Compiled-statement cache entries kept per engine (SQLAlchemy's default is
+# 500); generous so the canned queries below never get evicted
+QUERY_CACHE_SIZE = 1200
+
+# Rows buffered per fetch by _stream_query's server-side cursor
+STREAM_ROW_BUFFER = 500
+
+# Optional asyncpg pool for the step 7-9 polling queries (see open_pool);
+# asyncpg prepares each statement once per connection and caches it by SQL text
+ASYNC_POOL_MIN_SIZE = 2
+ASYNC_POOL_MAX_SIZE = 4
+STATEMENT_CACHE_SIZE = 64
+
+# LISTEN channels and triggers installed by sql/workspace_status_notify.sql
+# and sql/snapshot_status_notify.sql
+STATUS_CHANNEL = "workspace_status"
+_STATUS_TRIGGER = "workspace_status_notify"
+SNAPSHOT_STATUS_CHANNEL = "snapshot_status"
+_SNAPSHOT_STATUS_TRIGGER = "snapshot_status_notify"
+
+# Current status reads run right after LISTEN, keyed by workspace id
+_CURRENT_WORKSPACE_STATUS = "SELECT status::text FROM workspaces WHERE id = $1"
+_CURRENT_SNAPSHOT_STATUS = """
+    SELECT status::text FROM snapshots
+    WHERE workspace_id = $1
+    ORDER BY created_at DESC
+    LIMIT 1
+"""
+
+# Canned statements for the per-poll lookups, built once at import instead
+# of re-wrapping the SQL string with text() on every call
+_USER_QUERY = text("""
+    SELECT id, email, totp_secret, is_deleted, created_at
+    FROM users
+    WHERE lower(email) = lower(:email) AND NOT is_deleted
+    LIMIT 1
+""")
+_WORKSPACE_QUERY = text("""
+    SELECT id, ulid, status, email, first_name, last_name,
+           created_at, is_deleted
+    FROM workspaces
+    WHERE lower(email) = lower(:email) AND NOT is_deleted
+    ORDER BY created_at DESC
+    LIMIT 1
+""")
+_WORKSPACE_STATUS_QUERY = text(
+    "SELECT status FROM workspaces WHERE id = :workspace_id AND NOT is_deleted"
+)
+_ENTITY_COUNTS_QUERY = text("""
+    SELECT 'categories', COUNT(*) FROM workspace_categories
+    WHERE workspace_id = :workspace_id AND NOT is_deleted
+    UNION ALL
+    SELECT 'prompts', COUNT(*) FROM workspace_prompts
+    WHERE workspace_id = :workspace_id AND NOT is_deleted
+    UNION ALL
+    SELECT 'competitors', COUNT(*) FROM workspace_competitors
+    WHERE workspace_id = :workspace_id AND NOT is_deleted
+""")
+_LATEST_SNAPSHOT_QUERY = text("""
+    SELECT id, status, created_at
+    FROM snapshots
+    WHERE workspace_id = :workspace_id
+    ORDER BY created_at DESC
+    LIMIT 1
+""")
+
+# Snapshot prompt statuses reported by get_snapshot_prompts_status, counted
+# (with the total) in one scan as a fixed set of columns
+_PROMPT_STATUSES = ("pending", "processing", "completed", "failed")
+_PROMPT_STATUS_COLUMNS = "COUNT(*) AS total, " + ", ".join(
+    f"COUNT(*) FILTER (WHERE lower(status::text) = '{status}') AS {status}"
+    for status in _PROMPT_STATUSES
+)
+_PROMPT_STATUS_KEYS = ("total",) + _PROMPT_STATUSES
+
+# Everything full_verification checks, in one round trip: the user and
+# workspace rows (same columns as get_user/get_workspace), the three entity
+# counts, the latest snapshot and its prompt status counts
+_VERIFICATION_BUNDLE_QUERY = text(f"""
+    WITH u AS (
+        SELECT id, email, totp_secret, is_deleted, created_at
+        FROM users
+        WHERE lower(email) = lower(:email) AND NOT is_deleted
+        LIMIT 1
+    ),
+    w AS (
+        SELECT id, ulid, status, email, first_name, last_name,
+               created_at, is_deleted
+        FROM workspaces
+        WHERE lower(email) = lower(:email) AND NOT is_deleted
+        ORDER BY created_at DESC
+        LIMIT 1
+    ),
+    s AS (
+        SELECT sn.id, sn.status, sn.created_at
+        FROM snapshots sn JOIN w ON sn.workspace_id = w.id
+        ORDER BY sn.created_at DESC
+        LIMIT 1
+    )
+    SELECT u.id, u.email, u.totp_secret, u.is_deleted, u.created_at,
+           w.id, w.ulid, w.status, w.email, w.first_name, w.last_name,
+           w.created_at, w.is_deleted,
+           (SELECT COUNT(*) FROM workspace_categories c
+            WHERE c.workspace_id = w.id AND NOT c.is_deleted),
+           (SELECT COUNT(*) FROM workspace_prompts p
+            WHERE p.workspace_id = w.id AND NOT p.is_deleted),
+           (SELECT COUNT(*) FROM workspace_competitors wc
+            WHERE wc.workspace_id = w.id AND NOT wc.is_deleted),
+           s.id, s.status, s.created_at,
+           (SELECT row_to_json(sp) FROM (
+                SELECT {_PROMPT_STATUS_COLUMNS} FROM snapshot_prompts
+                WHERE snapshot_id = s.id) sp)
+    FROM (SELECT 1) AS one
+    LEFT JOIN u ON true
+    LEFT JOIN w ON true
+    LEFT JOIN s ON true
+""")
+
+# Rows per list in the step 11 report
+REPORT_LIST_LIMIT = 10
+REPORT_SLOWEST_LIMIT = 5
+
+# Everything get_comprehensive_data reports, as one JSON object in one round
+# trip. Per-model stats (with their grand-total row) come back as an array so
+# they split through the same helper as the single-purpose query; prompt
+# status counts as an object.
+_COMPREHENSIVE_DATA_QUERY = text(f"""
+    WITH w AS (
+        SELECT id, ulid, status, email, created_at
+        FROM workspaces
+        WHERE lower(email) = lower(:email) AND NOT is_deleted
+        ORDER BY created_at DESC
+        LIMIT 1
+    ),
+    s AS (
+        SELECT sn.id, sn.status, sn.created_at
+        FROM snapshots sn JOIN w ON sn.workspace_id = w.id
+        ORDER BY sn.created_at DESC
+        LIMIT 1
+    ),
+    c AS (
+        SELECT c.id, c.name, c.created_at
+        FROM workspace_categories c JOIN w ON c.workspace_id = w.id
+        WHERE NOT c.is_deleted
+    ),
+    p AS (
+        SELECT p.id, p.name, p.is_tracked, p.created_at
+        FROM workspace_prompts p JOIN w ON p.workspace_id = w.id
+        WHERE NOT p.is_deleted
+    ),
+    comp AS (
+        SELECT wc.id,
+               COALESCE(NULLIF(bdi.name, ''), bdi.domain, 'Unknown') AS name,
+               COALESCE(bdi.domain, 'N/A') AS domain,
+               wc.created_at
+        FROM workspace_competitors wc
+        JOIN w ON wc.workspace_id = w.id
+        LEFT JOIN brand_domain_info bdi ON wc.brand_domain_info_id = bdi.id
+        WHERE NOT wc.is_deleted
+    ),
+    mi AS (
+        SELECT m.model, m.time_elapsed, m.total_cost, m.total_tokens, m.created_at
+        FROM model_invocations m JOIN w ON m.workspace_id = w.id
+    ),
+    sp AS (
+        SELECT sp.id, wp.name, sp.status, sp.created_at
+        FROM snapshot_prompts sp
+        JOIN s ON sp.snapshot_id = s.id
+        JOIN workspace_prompts wp ON sp.workspace_prompt_id = wp.id
+    )
+    SELECT json_build_object(
+        'workspace', (SELECT row_to_json(w) FROM w),
+        'snapshot', (SELECT row_to_json(s) FROM s),
+        'categories_count', (SELECT COUNT(*) FROM c),
+        'categories_list', (SELECT json_agg(x) FROM (
+            SELECT * FROM c ORDER BY created_at ASC LIMIT :list_limit) x),
+        'prompts_count', (SELECT COUNT(*) FROM p),
+        'prompts_list', (SELECT json_agg(x) FROM (
+            SELECT * FROM p ORDER BY created_at ASC LIMIT :list_limit) x),
+        'competitors_count', (SELECT COUNT(*) FROM comp),
+        'competitors_list', (SELECT json_agg(x) FROM (
+            SELECT * FROM comp ORDER BY created_at ASC LIMIT :list_limit) x),
+        'model_invocations', (SELECT json_agg(json_build_array(
+            model, call_count, avg_time, total_time, total_cost, total_tokens,
+            is_total)) FROM (
+            SELECT model, COUNT(*) AS call_count,
+                   ROUND(AVG(time_elapsed)::numeric, 2) AS avg_time,
+                   ROUND(SUM(time_elapsed)::numeric, 2) AS total_time,
+                   ROUND(SUM(total_cost)::numeric, 4) AS total_cost,
+                   SUM(total_tokens) AS total_tokens,
+                   GROUPING(model) AS is_total
+            FROM mi GROUP BY GROUPING SETS ((model), ())
+            ORDER BY total_time DESC) x),
+        'slowest_invocations', (SELECT json_agg(x) FROM (
+            SELECT model, time_elapsed, total_tokens, created_at FROM mi
+            WHERE time_elapsed IS NOT NULL
+            ORDER BY time_elapsed DESC LIMIT :slowest_limit) x),
+        'snapshot_prompts_status', (SELECT row_to_json(x) FROM (
+            SELECT {_PROMPT_STATUS_COLUMNS} FROM snapshot_prompts
+            WHERE snapshot_id = (SELECT id FROM s)) x),
+        'snapshot_prompts_list', (SELECT json_agg(x) FROM (
+            SELECT * FROM sp ORDER BY created_at ASC LIMIT :list_limit) x)
+    )
+""")
+
 
 @dataclass
 class VerificationResult:
@@ -33,6 +251,63 @@ class VerificationResult:
     data: Optional[Dict[str, Any]] = None
 
 
+@dataclass(frozen=True)
+class _NotifyWatch:
+    """One channel to LISTEN on and the statuses to wait for."""
+    channel: str
+    trigger: str
+    key: str
+    targets: FrozenSet[str]
+    current_query: str
+
+
+def _statement(query: str | TextClause) -> TextClause:
+    """Wrap ad-hoc SQL with text(); prebuilt statements pass through as-is."""
+    return text(query) if isinstance(query, str) else query
+
+
+def _iso_created_at(rows: list) -> list:
+    """Format each row's created_at as an ISO string, in place."""
+    for row in rows:
+        created_at = row["created_at"]
+        row["created_at"] = created_at.isoformat() if created_at is not None else None
+    return rows
+
+
+def _model_stats(rows: Iterable) -> Dict[str, Any]:
+    """
+    Split model invocation rows into a by-model breakdown and the totals.
+
+    The rows come from GROUP BY GROUPING SETS ((model), ()): per-model rows
+    plus one grand-total row, flagged by GROUPING(model) in the last column.
+    """
+    stats = {
+        "by_model": [],
+        "total_calls": 0,
+        "total_time": 0.0,
+        "total_cost": 0.0,
+        "total_tokens": 0
+    }
+
+    for row in rows:
+        if row[6]:
+            stats["total_calls"] = row[1]
+            stats["total_time"] = float(row[3]) if row[3] else 0.0
+            stats["total_cost"] = float(row[4]) if row[4] else 0.0
+            stats["total_tokens"] = row[5] or 0
+            continue
+        stats["by_model"].append({
+            "model": row[0],
+            "call_count": row[1],
+            "avg_time": float(row[2]) if row[2] else 0,
+            "total_time": float(row[3]) if row[3] else 0,
+            "total_cost": float(row[4]) if row[4] else 0,
+            "total_tokens": row[5] or 0
+        })
+
+    return stats
+
+
 class DBVerifier:
     """
     Database verifier for canary tests.
@@ -44,6 +319,31 @@ class DBVerifier:
     relationships and dependencies.
     """
 
+    # Connection string -> Engine, shared by every verifier in the process
+    _shared_engines: Dict[str, Engine] = {}
+
+    @classmethod
+    def _shared_engine(cls, connection_string: str) -> Engine:
+        """Create the pooled engine for a database once per process."""
+        engine = cls._shared_engines.get(connection_string)
+        if engine is None:
+            engine = cls._shared_engines[connection_string] = create_engine(
+                connection_string,
+                pool_size=POOL_SIZE,
+                max_overflow=POOL_MAX_OVERFLOW,
+                pool_pre_ping=True,
+                pool_recycle=POOL_RECYCLE_SECONDS,
+                query_cache_size=QUERY_CACHE_SIZE
+            )
+        return engine
+
+    @classmethod
+    def dispose_shared_engine(cls) -> None:
+        """Dispose the shared engines and their pools (call at process exit)."""
+        engines, cls._shared_engines = cls._shared_engines, {}
+        for engine in engines.values():
+            engine.dispose()
+
     def __init__(self, connection_string: str, test_email: str):
         """
         Initialize the DB verifier.
@@ -52,36 +352,124 @@ class DBVerifier:
             connection_string: PostgreSQL connection string
             test_email: The canary test email to verify
         """
-        self.engine: Engine = create_engine(connection_string)
+        self.engine: Engine = self._shared_engine(connection_string)
         self.test_email = test_email
         self._user_cache = None
+        # The user's TOTP secret, decrypted once for the OTP polls
+        self._decrypted_secret: Optional[str] = None
+        # TOTP generator built once from it, so each new window skips the base32 decode
+        self._totp: Optional[pyotp.TOTP] = None
+        # (window start, token) of the last OTP; the token is fixed per window
+        self._otp_token: Optional[Tuple[int, str]] = None
         self._workspace_cache = None
+        self._counts_cache: Dict[int, Dict[str, int]] = {}
+        # Latest snapshot per workspace id (see refresh_snapshot), and prompt
+        # status counts per snapshot id once no prompt is left to run
+        self._snapshot_cache: Dict[int, dict] = {}
+        self._prompts_status_cache: Dict[int, Dict[str, int]] = {}
+        self._pool = None
+        # Connection held by `with verifier:` in the current thread
+        self._local = threading.local()
+
+    def __enter__(self) -> "DBVerifier":
+        """
+        Run this thread's queries on one read-only connection and transaction.
 
-    def _execute_query(self, query: str, params: dict = None) -> list:
-        """Execute a raw SQL query and return results."""
-        with self.engine.connect() as conn:
-            result = conn.execute(text(query), params or {})
+        For read-only batches such as full_verification(): one pool checkout
+        and one BEGIN/COMMIT instead of one per query. Other threads keep
+        checking out their own connections.
+        """
+        conn = self.engine.connect().execution_options(postgresql_readonly=True)
+        conn.begin()
+        self._local.conn = conn
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        conn, self._local.conn = self._local.conn, None
+        try:
+            if exc_type is None:
+                conn.commit()
+        finally:
+            conn.close()
+
+    def _connection(self):
+        """This thread's `with` connection if any, else a fresh pool checkout."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return nullcontext(conn)
+        return self.engine.connect()
+
+    def _asyncpg_dsn(self) -> str:
+        """The engine URL as a plain postgresql:// DSN for asyncpg."""
+        return self.engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+    async def open_pool(self) -> bool:
+        """
+        Open the asyncpg pool used by the *_async polling methods.
+
+        Returns:
+            False if asyncpg is not installed or the connect fails; the
+            *_async methods then run the sync queries in a worker thread
+        """
+        try:
+            import asyncpg
+        except ImportError:
+            return False
+
+        try:
+            self._pool = await asyncpg.create_pool(
+                self._asyncpg_dsn(),
+                min_size=ASYNC_POOL_MIN_SIZE,
+                max_size=ASYNC_POOL_MAX_SIZE,
+                statement_cache_size=STATEMENT_CACHE_SIZE
+            )
+        except Exception as e:
+            logger.warning("asyncpg pool unavailable, polling through the sync engine: %s", e)
+            return False
+        return True
+
+    async def close_pool(self) -> None:
+        """Close the asyncpg pool if open_pool() opened one."""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            await pool.close()
+
+    def warm_up(self) -> None:
+        """Open the first pooled connection so step 4 doesn't pay for the connect."""
+        self._execute_scalar("SELECT 1")
+
+    def _execute_query(self, query: str | TextClause, params: dict = None) -> list:
+        """Execute a raw SQL query (or a prebuilt text() statement) and return results."""
+        with self._connection() as conn:
+            result = conn.execute(_statement(query), params or {})
             return result.fetchall()
 
-    def _execute_scalar(self, query: str, params: dict = None):
+    def _execute_mapping(self, query: str | TextClause, params: dict = None) -> list:
+        """Execute a query and return its rows as dicts keyed by column name."""
+        with self._connection() as conn:
+            result = conn.execute(_statement(query), params or {})
+            return [dict(row) for row in result.mappings()]
+
+    def _stream_query(self, query: str | TextClause, params: dict = None) -> Iterator:
+        """Execute a query on a server-side cursor and yield its rows lazily."""
+        with self._connection() as conn:
+            result = conn.execute(
+                _statement(query), params or {},
+                execution_options={"stream_results": True, "max_row_buffer": STREAM_ROW_BUFFER}
+            )
+            yield from result
+
+    def _execute_scalar(self, query: str | TextClause, params: dict = None):
         """Execute a query and return a single value."""
-        with self.engine.connect() as conn:
-            result = conn.execute(text(query), params or {})
-            row = result.fetchone()
-            return row[0] if row else None
+        with self._connection() as conn:
+            return conn.execute(_statement(query), params or {}).scalar()
 
     def get_user(self) -> Optional[dict]:
         """Get the canary test user by email."""
         if self._user_cache is not None:
             return self._user_cache
 
-        query = """
-            SELECT id, email, totp_secret, is_deleted, created_at
-            FROM users
-            WHERE email ILIKE :email AND NOT is_deleted
-            LIMIT 1
-        """
-        rows = self._execute_query(query, {"email": self.test_email})
+        rows = self._execute_query(_USER_QUERY, {"email": self.test_email})
         if rows:
             row = rows[0]
             self._user_cache = {
@@ -103,19 +491,24 @@ class DBVerifier:
         """
         user = self.get_user()
         if not user:
-            logger.warning(f"User not found for email: {self.test_email}")
+            logger.warning("User not found for email: %s", self.test_email)
             return None
 
         if not user.get("totp_secret"):
-            logger.warning(f"User {self.test_email} has no TOTP secret")
+            logger.warning("User %s has no TOTP secret", self.test_email)
             return None
 
         try:
-            decrypted_secret = decrypt_string(user["totp_secret"])
-            otp_code = generate_totp_token(decrypted_secret)
-            return otp_code
+            if self._decrypted_secret is None:
+                self._decrypted_secret = decrypt_string(user["totp_secret"])
+            if self._totp is None:
+                self._totp = pyotp.TOTP(self._decrypted_secret)
+            window = totp_window_start()
+            if self._otp_token is None or self._otp_token[0] != window:
+                self._otp_token = (window, generate_totp_token(self._totp, window))
+            return self._otp_token[1]
         except Exception as e:
-            logger.error(f"Failed to generate OTP for user {self.test_email}: {e}")
+            logger.error("Failed to generate OTP for user %s: %s", self.test_email, e)
             return None
 
     def verify_user_exists(self) -> VerificationResult:
@@ -137,15 +530,7 @@ class DBVerifier:
         if self._workspace_cache is not None:
             return self._workspace_cache
 
-        query = """
-            SELECT id, ulid, status, email, first_name, last_name,
-                   created_at, is_deleted
-            FROM workspaces
-            WHERE email ILIKE :email AND NOT is_deleted
-            ORDER BY created_at DESC
-            LIMIT 1
-        """
-        rows = self._execute_query(query, {"email": self.test_email})
+        rows = self._execute_query(_WORKSPACE_QUERY, {"email": self.test_email})
         if rows:
             row = rows[0]
             self._workspace_cache = {
@@ -164,8 +549,47 @@ class DBVerifier:
     def refresh_workspace(self) -> Optional[dict]:
         """Clear workspace cache and get fresh data."""
         self._workspace_cache = None
+        self._counts_cache.clear()
         return self.get_workspace()
 
+    def refresh_workspace_status(self) -> Optional[dict]:
+        """
+        Re-read only the status of the cached workspace.
+
+        Keeps the rest of the cached row (and the counts cache) instead of
+        re-fetching everything; falls back to refresh_workspace() when
+        nothing is cached yet.
+        """
+        workspace = self._workspace_cache
+        if workspace is None:
+            return self.refresh_workspace()
+
+        status = self._execute_scalar(
+            _WORKSPACE_STATUS_QUERY, {"workspace_id": workspace["id"]}
+        )
+        self._workspace_cache = {**workspace, "status": status} if status is not None else None
+        return self._workspace_cache
+
+    async def refresh_workspace_async(self) -> Optional[dict]:
+        """refresh_workspace() on the asyncpg pool, for the polling loops."""
+        if self._pool is None:
+            return await asyncio.to_thread(self.refresh_workspace)
+
+        row = await self._pool.fetchrow(
+            """
+                SELECT id, ulid, status, email, first_name, last_name,
+                       created_at, is_deleted
+                FROM workspaces
+                WHERE lower(email) = lower($1) AND NOT is_deleted
+                ORDER BY created_at DESC
+                LIMIT 1
+            """,
+            self.test_email
+        )
+        self._workspace_cache = dict(row) if row else None
+        self._counts_cache.clear()
+        return self._workspace_cache
+
     def verify_workspace_created(self) -> VerificationResult:
         """Verify that a workspace was created for the test email."""
         workspace = self.get_workspace()
@@ -184,9 +608,14 @@ class DBVerifier:
             message=f"Workspace not found for email: {self.test_email}"
         )
 
-    def verify_workspace_status(self, expected_status: str) -> VerificationResult:
-        """Verify workspace has reached the expected status."""
-        workspace = self.refresh_workspace()
+    def verify_workspace_status(
+        self, expected_status: str, workspace: Optional[dict] = None
+    ) -> VerificationResult:
+        """Verify workspace has reached the expected status.
+
+        Re-reads the workspace status unless an already-fetched row is passed in.
+        """
+        workspace = workspace or self.refresh_workspace_status()
         if not workspace:
             return VerificationResult(
                 success=False,
@@ -206,16 +635,192 @@ class DBVerifier:
             data={"workspace_id": workspace["id"], "actual_status": workspace["status"]}
         )
 
-    def get_categories_count(self, workspace_id: int) -> int:
-        """Get the count of categories for a workspace."""
+    async def verify_workspace_status_async(self, expected_status: str) -> VerificationResult:
+        """verify_workspace_status() on a fresh row read through the asyncpg pool."""
+        workspace = await self.refresh_workspace_async()
+        if not workspace:
+            return VerificationResult(
+                success=False,
+                message="Workspace not found"
+            )
+        return self.verify_workspace_status(expected_status, workspace)
+
+    def get_workspace_snapshot(self) -> Optional[dict]:
+        """
+        Get the workspace status with its category and prompt counts.
+
+        One round-trip for the step 7/8 polling loops, which would otherwise
+        issue a separate query per status and count.
+        """
         query = """
-            SELECT COUNT(*) FROM workspace_categories
-            WHERE workspace_id = :workspace_id AND NOT is_deleted
+            SELECT w.id, w.status,
+                   (SELECT COUNT(*) FROM workspace_categories c
+                    WHERE c.workspace_id = w.id AND NOT c.is_deleted),
+                   (SELECT COUNT(*) FROM workspace_prompts p
+                    WHERE p.workspace_id = w.id AND NOT p.is_deleted)
+            FROM workspaces w
+            WHERE lower(w.email) = lower(:email) AND NOT w.is_deleted
+            ORDER BY w.created_at DESC
+            LIMIT 1
+        """
+        rows = self._execute_query(query, {"email": self.test_email})
+        if rows:
+            row = rows[0]
+            return {
+                "workspace_id": row[0],
+                "status": row[1],
+                "categories_count": row[2],
+                "prompts_count": row[3]
+            }
+        return None
+
+    def _status_watch(self, workspace: dict, targets: Iterable[str]) -> _NotifyWatch:
+        """Watch the workspace_status channel (sql/workspace_status_notify.sql)."""
+        return _NotifyWatch(
+            STATUS_CHANNEL, _STATUS_TRIGGER, workspace["ulid"], frozenset(targets),
+            _CURRENT_WORKSPACE_STATUS
+        )
+
+    def _snapshot_status_watch(self, workspace: dict, targets: Iterable[str]) -> _NotifyWatch:
+        """Watch the snapshot_status channel (sql/snapshot_status_notify.sql)."""
+        return _NotifyWatch(
+            SNAPSHOT_STATUS_CHANNEL, _SNAPSHOT_STATUS_TRIGGER, str(workspace["id"]),
+            frozenset(targets), _CURRENT_SNAPSHOT_STATUS
+        )
+
+    async def wait_for_status(self, targets: Iterable[str], timeout: float) -> Optional[str]:
+        """
+        Wait for the workspace to reach one of the target statuses.
+
+        Listens on the workspace_status channel (see
+        sql/workspace_status_notify.sql) instead of polling.
+
+        Returns:
+            The status reached, or None if notifications are unavailable
+            (asyncpg missing, trigger not installed, no workspace yet) and
+            the caller should poll instead
+
+        Raises:
+            asyncio.TimeoutError: If no target status arrives within timeout
+        """
+        workspace = self.get_workspace()
+        if not workspace:
+            return None
+        return await self._wait_for_notify(
+            [self._status_watch(workspace, targets)], workspace["id"], timeout
+        )
+
+    async def wait_for_snapshot_status(self, targets: Iterable[str], timeout: float) -> Optional[str]:
+        """
+        Wait for the workspace's latest snapshot to reach one of the target statuses.
+
+        Same contract as wait_for_status(), on the snapshot_status channel.
+        """
+        workspace = self.get_workspace()
+        if not workspace:
+            return None
+        return await self._wait_for_notify(
+            [self._snapshot_status_watch(workspace, targets)], workspace["id"], timeout
+        )
+
+    async def wait_for_completion(self, timeout: float) -> Optional[str]:
+        """
+        Wait until the workspace is COMPLETED or its latest snapshot FAILED.
+
+        Listens on both status channels over one connection; same contract
+        as wait_for_status(). Returns "COMPLETED" or "FAILED".
+        """
+        workspace = self.get_workspace()
+        if not workspace:
+            return None
+        return await self._wait_for_notify(
+            [
+                self._status_watch(workspace, {"COMPLETED"}),
+                self._snapshot_status_watch(workspace, {"FAILED"})
+            ],
+            workspace["id"], timeout
+        )
+
+    async def _wait_for_notify(
+        self,
+        watches: Sequence[_NotifyWatch],
+        current_arg: Any,
+        timeout: float
+    ) -> Optional[str]:
+        """LISTEN for '<key>:<status>' payloads until any watch sees a target status.
+
+        All watches share one connection; every trigger must be installed.
+        """
+        try:
+            import asyncpg
+        except ImportError:
+            return None
+
+        reached = asyncio.get_running_loop().create_future()
+
+        def listener(watch: _NotifyWatch):
+            def on_notify(connection, pid, notify_channel, payload):
+                notified_key, _, status = payload.partition(":")
+                if notified_key == watch.key and status in watch.targets and not reached.done():
+                    reached.set_result(status)
+            return on_notify
+
+        try:
+            conn = await asyncpg.connect(self._asyncpg_dsn())
+        except Exception as e:
+            logger.warning("Status LISTEN unavailable, falling back to polling: %s", e)
+            return None
+
+        try:
+            for watch in watches:
+                installed = await conn.fetchval(
+                    "SELECT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = $1)",
+                    watch.trigger
+                )
+                if not installed:
+                    return None
+
+                await conn.add_listener(watch.channel, listener(watch))
+
+            # The status may have changed before LISTEN took effect
+            for watch in watches:
+                current = await conn.fetchval(watch.current_query, current_arg)
+                if current in watch.targets:
+                    return current
+
+            return await asyncio.wait_for(reached, timeout)
+        except asyncpg.PostgresError as e:
+            logger.warning("Status LISTEN failed, falling back to polling: %s", e)
+            return None
+        finally:
+            await conn.close()
+
+    def get_entity_counts(self, workspace_id: int) -> Dict[str, int]:
+        """
+        Get the categories, prompts and competitors counts in one query.
+
+        Cached until the workspace row is next refreshed, so the three
+        get_*_count calls of one verification pass share a round trip.
         """
-        return self._execute_scalar(query, {"workspace_id": workspace_id}) or 0
+        counts = self._counts_cache.get(workspace_id)
+        if counts is not None:
+            return counts
+
+        rows = self._execute_query(_ENTITY_COUNTS_QUERY, {"workspace_id": workspace_id})
+        counts = self._counts_cache[workspace_id] = {row[0]: row[1] for row in rows}
+        return counts
+
+    def get_categories_count(self, workspace_id: int) -> int:
+        """Get the count of categories for a workspace (see get_entity_counts)."""
+        return self.get_entity_counts(workspace_id)["categories"]
 
-    def verify_categories_created(self, min_count: int = 3) -> VerificationResult:
-        """Verify that categories were created for the workspace."""
+    def verify_categories_created(
+        self, min_count: int = 3, count: Optional[int] = None
+    ) -> VerificationResult:
+        """Verify that categories were created for the workspace.
+
+        Counts them unless an already-fetched count is passed in.
+        """
         workspace = self.get_workspace()
         if not workspace:
             return VerificationResult(
@@ -223,7 +828,8 @@ class DBVerifier:
                 message="Workspace not found"
             )
 
-        count = self.get_categories_count(workspace["id"])
+        if count is None:
+            count = self.get_categories_count(workspace["id"])
         if count >= min_count:
             return VerificationResult(
                 success=True,
@@ -238,15 +844,16 @@ class DBVerifier:
         )
 
     def get_prompts_count(self, workspace_id: int) -> int:
-        """Get the count of prompts for a workspace."""
-        query = """
-            SELECT COUNT(*) FROM workspace_prompts
-            WHERE workspace_id = :workspace_id AND NOT is_deleted
-        """
-        return self._execute_scalar(query, {"workspace_id": workspace_id}) or 0
+        """Get the count of prompts for a workspace (see get_entity_counts)."""
+        return self.get_entity_counts(workspace_id)["prompts"]
+
+    def verify_prompts_created(
+        self, min_count: int = 15, count: Optional[int] = None
+    ) -> VerificationResult:
+        """Verify that prompts were created for the workspace.
 
-    def verify_prompts_created(self, min_count: int = 15) -> VerificationResult:
-        """Verify that prompts were created for the workspace."""
+        Counts them unless an already-fetched count is passed in.
+        """
         workspace = self.get_workspace()
         if not workspace:
             return VerificationResult(
@@ -254,7 +861,8 @@ class DBVerifier:
                 message="Workspace not found"
             )
 
-        count = self.get_prompts_count(workspace["id"])
+        if count is None:
+            count = self.get_prompts_count(workspace["id"])
         if count >= min_count:
             return VerificationResult(
                 success=True,
@@ -269,25 +877,53 @@ class DBVerifier:
         )
 
     def get_latest_snapshot(self, workspace_id: int) -> Optional[dict]:
-        """Get the latest snapshot for a workspace."""
-        query = """
-            SELECT id, status, created_at
-            FROM snapshots
-            WHERE workspace_id = :workspace_id
-            ORDER BY created_at DESC
-            LIMIT 1
+        """Get the latest snapshot for a workspace.
+
+        Cached per workspace, so the verify_snapshot_* checks of one pass
+        share a query; refresh_snapshot() re-reads it.
         """
-        rows = self._execute_query(query, {"workspace_id": workspace_id})
+        snapshot = self._snapshot_cache.get(workspace_id)
+        if snapshot is not None:
+            return snapshot
+
+        rows = self._execute_query(_LATEST_SNAPSHOT_QUERY, {"workspace_id": workspace_id})
         if rows:
             row = rows[0]
-            return {
+            snapshot = self._snapshot_cache[workspace_id] = {
                 "id": row[0],
                 "status": row[1],
                 "created_at": row[2]
             }
+            return snapshot
         return None
 
-    def verify_snapshot_created(self) -> VerificationResult:
+    def refresh_snapshot(self, workspace_id: int) -> Optional[dict]:
+        """Clear the cached snapshot of a workspace and get fresh data."""
+        self._snapshot_cache.pop(workspace_id, None)
+        return self.get_latest_snapshot(workspace_id)
+
+    async def get_latest_snapshot_async(self, workspace_id: int) -> Optional[dict]:
+        """refresh_snapshot() on the asyncpg pool, for the polling loops."""
+        if self._pool is None:
+            return await asyncio.to_thread(self.refresh_snapshot, workspace_id)
+
+        row = await self._pool.fetchrow(
+            """
+                SELECT id, status, created_at
+                FROM snapshots
+                WHERE workspace_id = $1
+                ORDER BY created_at DESC
+                LIMIT 1
+            """,
+            workspace_id
+        )
+        if row is None:
+            self._snapshot_cache.pop(workspace_id, None)
+            return None
+        snapshot = self._snapshot_cache[workspace_id] = dict(row)
+        return snapshot
+
+    def verify_snapshot_created(self, snapshot: Optional[dict] = None) -> VerificationResult:
         """Verify that a snapshot was created for the workspace."""
         workspace = self.get_workspace()
         if not workspace:
@@ -296,7 +932,7 @@ class DBVerifier:
                 message="Workspace not found"
             )
 
-        snapshot = self.get_latest_snapshot(workspace["id"])
+        snapshot = snapshot or self.get_latest_snapshot(workspace["id"])
         if snapshot:
             return VerificationResult(
                 success=True,
@@ -314,7 +950,7 @@ class DBVerifier:
             data={"workspace_id": workspace["id"]}
         )
 
-    def verify_snapshot_completed(self) -> VerificationResult:
+    def verify_snapshot_completed(self, snapshot: Optional[dict] = None) -> VerificationResult:
         """Verify that the latest snapshot is completed."""
         workspace = self.get_workspace()
         if not workspace:
@@ -323,7 +959,7 @@ class DBVerifier:
                 message="Workspace not found"
             )
 
-        snapshot = self.get_latest_snapshot(workspace["id"])
+        snapshot = snapshot or self.get_latest_snapshot(workspace["id"])
         if not snapshot:
             return VerificationResult(
                 success=False,
@@ -352,34 +988,50 @@ class DBVerifier:
             }
         )
 
+    def _store_prompts_status(self, snapshot_id: int, row) -> Dict[str, int]:
+        """Build the status counts dict, caching it once every prompt has settled."""
+        counts = dict(zip(_PROMPT_STATUS_KEYS, row))
+        if counts["total"] and not counts["pending"] and not counts["processing"]:
+            self._prompts_status_cache[snapshot_id] = counts
+        return counts
+
     def get_snapshot_prompts_status(self, snapshot_id: int) -> Dict[str, int]:
         """Get counts of snapshot prompts by status."""
-        query = """
-            SELECT status, COUNT(*) as count
+        counts = self._prompts_status_cache.get(snapshot_id)
+        if counts is not None:
+            return counts
+
+        query = f"""
+            SELECT {_PROMPT_STATUS_COLUMNS}
             FROM snapshot_prompts
             WHERE snapshot_id = :snapshot_id
-            GROUP BY status
         """
-        rows = self._execute_query(query, {"snapshot_id": snapshot_id})
-
-        status_counts = {
-            "total": 0,
-            "pending": 0,
-            "processing": 0,
-            "completed": 0,
-            "failed": 0
-        }
-
-        for row in rows:
-            status = row[0].lower() if row[0] else "unknown"
-            count = row[1]
-            status_counts["total"] += count
-            if status in status_counts:
-                status_counts[status] = count
-
-        return status_counts
+        row = self._execute_query(query, {"snapshot_id": snapshot_id})[0]
+        return self._store_prompts_status(snapshot_id, row)
+
+    async def get_snapshot_prompts_status_async(self, snapshot_id: int) -> Dict[str, int]:
+        """get_snapshot_prompts_status() on the asyncpg pool, for the polling loops."""
+        counts = self._prompts_status_cache.get(snapshot_id)
+        if counts is not None:
+            return counts
+        if self._pool is None:
+            return await asyncio.to_thread(self.get_snapshot_prompts_status, snapshot_id)
+
+        row = await self._pool.fetchrow(
+            f"""
+                SELECT {_PROMPT_STATUS_COLUMNS}
+                FROM snapshot_prompts
+                WHERE snapshot_id = $1
+            """,
+            snapshot_id
+        )
+        return self._store_prompts_status(snapshot_id, row)
 
-    def verify_all_prompts_completed(self) -> VerificationResult:
+    def verify_all_prompts_completed(
+        self,
+        snapshot: Optional[dict] = None,
+        status_counts: Optional[Dict[str, int]] = None
+    ) -> VerificationResult:
         """Verify all snapshot prompts are completed."""
         workspace = self.get_workspace()
         if not workspace:
@@ -388,14 +1040,15 @@ class DBVerifier:
                 message="Workspace not found"
             )
 
-        snapshot = self.get_latest_snapshot(workspace["id"])
+        snapshot = snapshot or self.get_latest_snapshot(workspace["id"])
         if not snapshot:
             return VerificationResult(
                 success=False,
                 message="No snapshot found"
             )
 
-        status_counts = self.get_snapshot_prompts_status(snapshot["id"])
+        if status_counts is None:
+            status_counts = self.get_snapshot_prompts_status(snapshot["id"])
 
         if status_counts["total"] == 0:
             return VerificationResult(
@@ -425,12 +1078,8 @@ class DBVerifier:
         )
 
     def get_competitors_count(self, workspace_id: int) -> int:
-        """Get the count of competitors for a workspace."""
-        query = """
-            SELECT COUNT(*) FROM workspace_competitors
-            WHERE workspace_id = :workspace_id AND NOT is_deleted
-        """
-        return self._execute_scalar(query, {"workspace_id": workspace_id}) or 0
+        """Get the count of competitors for a workspace (see get_entity_counts)."""
+        return self.get_entity_counts(workspace_id)["competitors"]
 
     def get_categories_list(self, workspace_id: int, limit: int = 10) -> list:
         """Get list of categories for a workspace."""
@@ -441,8 +1090,9 @@ class DBVerifier:
             ORDER BY created_at ASC
             LIMIT :limit
         """
-        rows = self._execute_query(query, {"workspace_id": workspace_id, "limit": limit})
-        return [{"id": r[0], "name": r[1], "created_at": str(r[2])} for r in rows]
+        return _iso_created_at(
+            self._execute_mapping(query, {"workspace_id": workspace_id, "limit": limit})
+        )
 
     def get_prompts_list(self, workspace_id: int, limit: int = 10) -> list:
         """Get list of prompts for a workspace."""
@@ -453,8 +1103,9 @@ class DBVerifier:
             ORDER BY created_at ASC
             LIMIT :limit
         """
-        rows = self._execute_query(query, {"workspace_id": workspace_id, "limit": limit})
-        return [{"id": r[0], "name": r[1], "is_tracked": r[2], "created_at": str(r[3])} for r in rows]
+        return _iso_created_at(
+            self._execute_mapping(query, {"workspace_id": workspace_id, "limit": limit})
+        )
 
     def get_competitors_list(self, workspace_id: int, limit: int = 10) -> list:
         """Get list of competitors for a workspace with brand info."""
@@ -469,8 +1120,10 @@ class DBVerifier:
             ORDER BY wc.created_at ASC
             LIMIT :limit
         """
-        rows = self._execute_query(query, {"workspace_id": workspace_id, "limit": limit})
-        return [{"id": r[0], "name": r[1] or "Unknown", "domain": r[2] or "N/A", "created_at": str(r[3])} for r in rows]
+        # name and domain fall back to 'Unknown' / 'N/A' in the SELECT
+        return _iso_created_at(
+            self._execute_mapping(query, {"workspace_id": workspace_id, "limit": limit})
+        )
 
     def get_model_invocations_stats(self, workspace_id: int) -> Dict[str, Any]:
         """Get model invocation statistics for a workspace."""
@@ -481,38 +1134,14 @@ class DBVerifier:
                 ROUND(AVG(time_elapsed)::numeric, 2) as avg_time,
                 ROUND(SUM(time_elapsed)::numeric, 2) as total_time,
                 ROUND(SUM(total_cost)::numeric, 4) as total_cost,
-                SUM(total_tokens) as total_tokens
+                SUM(total_tokens) as total_tokens,
+                GROUPING(model) as is_total
             FROM model_invocations
             WHERE workspace_id = :workspace_id
-            GROUP BY model
+            GROUP BY GROUPING SETS ((model), ())
             ORDER BY total_time DESC
         """
-        rows = self._execute_query(query, {"workspace_id": workspace_id})
-
-        stats = {
-            "by_model": [],
-            "total_calls": 0,
-            "total_time": 0.0,
-            "total_cost": 0.0,
-            "total_tokens": 0
-        }
-
-        for row in rows:
-            model_stat = {
-                "model": row[0],
-                "call_count": row[1],
-                "avg_time": float(row[2]) if row[2] else 0,
-                "total_time": float(row[3]) if row[3] else 0,
-                "total_cost": float(row[4]) if row[4] else 0,
-                "total_tokens": row[5] or 0
-            }
-            stats["by_model"].append(model_stat)
-            stats["total_calls"] += model_stat["call_count"]
-            stats["total_time"] += model_stat["total_time"]
-            stats["total_cost"] += model_stat["total_cost"]
-            stats["total_tokens"] += model_stat["total_tokens"]
-
-        return stats
+        return _model_stats(self._stream_query(query, {"workspace_id": workspace_id}))
 
     def get_slowest_model_invocations(self, workspace_id: int, limit: int = 5) -> list:
         """Get the slowest model invocations for debugging."""
@@ -523,13 +1152,13 @@ class DBVerifier:
             ORDER BY time_elapsed DESC
             LIMIT :limit
         """
-        rows = self._execute_query(query, {"workspace_id": workspace_id, "limit": limit})
-        return [{
-            "model": r[0],
-            "time_elapsed": float(r[1]) if r[1] else 0,
-            "total_tokens": r[2] or 0,
-            "created_at": str(r[3])
-        } for r in rows]
+        rows = _iso_created_at(
+            self._execute_mapping(query, {"workspace_id": workspace_id, "limit": limit})
+        )
+        for row in rows:
+            row["time_elapsed"] = float(row["time_elapsed"]) if row["time_elapsed"] else 0
+            row["total_tokens"] = row["total_tokens"] or 0
+        return rows
 
     def get_snapshot_prompts_list(self, snapshot_id: int, limit: int = 10) -> list:
         """Get list of snapshot prompts with their status."""
@@ -541,52 +1170,57 @@ class DBVerifier:
             ORDER BY sp.created_at ASC
             LIMIT :limit
         """
-        rows = self._execute_query(query, {"snapshot_id": snapshot_id, "limit": limit})
-        return [{"id": r[0], "name": r[1], "status": r[2], "created_at": str(r[3])} for r in rows]
+        return _iso_created_at(
+            self._execute_mapping(query, {"snapshot_id": snapshot_id, "limit": limit})
+        )
 
     def get_comprehensive_data(self) -> Dict[str, Any]:
-        """Get comprehensive data for detailed reporting."""
-        workspace = self.get_workspace()
-        if not workspace:
+        """
+        Get comprehensive data for detailed reporting.
+
+        The report's lookups are independent, so they run as one batched
+        query rather than one SELECT per field (see
+        get_comprehensive_data_batched). Timestamps come back as ISO strings.
+        """
+        return self.get_comprehensive_data_batched()
+
+    def get_comprehensive_data_batched(self) -> Dict[str, Any]:
+        """
+        Get the comprehensive report in a single query.
+
+        Step 11 hands the result to full_verification so the counts are
+        not queried again.
+        """
+        data = self._execute_scalar(_COMPREHENSIVE_DATA_QUERY, {
+            "email": self.test_email,
+            "list_limit": REPORT_LIST_LIMIT,
+            "slowest_limit": REPORT_SLOWEST_LIMIT
+        })
+        if not data or not data["workspace"]:
             return {"error": "Workspace not found"}
 
-        workspace_id = workspace["id"]
-        snapshot = self.get_latest_snapshot(workspace_id)
-
-        data = {
-            "workspace": {
-                "id": workspace_id,
-                "ulid": workspace["ulid"],
-                "status": workspace["status"],
-                "email": workspace["email"],
-                "created_at": str(workspace["created_at"])
-            },
-            "categories_count": self.get_categories_count(workspace_id),
-            "categories_list": self.get_categories_list(workspace_id),
-            "prompts_count": self.get_prompts_count(workspace_id),
-            "prompts_list": self.get_prompts_list(workspace_id),
-            "competitors_count": self.get_competitors_count(workspace_id),
-            "competitors_list": self.get_competitors_list(workspace_id),
-            "snapshot": None,
-            "snapshot_prompts_status": None,
-            "snapshot_prompts_list": None,
-            "model_invocations": self.get_model_invocations_stats(workspace_id),
-            "slowest_invocations": self.get_slowest_model_invocations(workspace_id)
-        }
+        for key in ("categories_list", "prompts_list", "competitors_list"):
+            data[key] = data[key] or []
+        data["model_invocations"] = _model_stats(data["model_invocations"] or [])
+        data["slowest_invocations"] = [{
+            "model": r["model"],
+            "time_elapsed": float(r["time_elapsed"]) if r["time_elapsed"] else 0,
+            "total_tokens": r["total_tokens"] or 0,
+            "created_at": r["created_at"]
+        } for r in data["slowest_invocations"] or []]
 
-        if snapshot:
-            data["snapshot"] = {
-                "id": snapshot["id"],
-                "status": snapshot["status"],
-                "created_at": str(snapshot["created_at"])
-            }
-            data["snapshot_prompts_status"] = self.get_snapshot_prompts_status(snapshot["id"])
-            data["snapshot_prompts_list"] = self.get_snapshot_prompts_list(snapshot["id"])
+        if data["snapshot"]:
+            data["snapshot_prompts_list"] = data["snapshot_prompts_list"] or []
 
         return data
 
-    def verify_competitors_found(self, min_count: int = 1) -> VerificationResult:
-        """Verify competitors were found for the workspace."""
+    def verify_competitors_found(
+        self, min_count: int = 1, count: Optional[int] = None
+    ) -> VerificationResult:
+        """Verify competitors were found for the workspace.
+
+        Counts them unless an already-fetched count is passed in.
+        """
         workspace = self.get_workspace()
         if not workspace:
             return VerificationResult(
@@ -594,7 +1228,8 @@ class DBVerifier:
                 message="Workspace not found"
             )
 
-        count = self.get_competitors_count(workspace["id"])
+        if count is None:
+            count = self.get_competitors_count(workspace["id"])
         if count >= min_count:
             return VerificationResult(
                 success=True,
@@ -608,15 +1243,85 @@ class DBVerifier:
             data={"workspace_id": workspace["id"], "competitors_count": count}
         )
 
-    def full_verification(self) -> Dict[str, Any]:
+    def _fetch_verification_bundle(self) -> Dict[str, Any]:
+        """
+        Load everything full_verification checks in one query.
+
+        Fills the user and workspace caches, so the verify_* calls that read
+        them don't query again, and returns the counts and latest snapshot in
+        the shape of get_comprehensive_data_batched().
+        """
+        row = self._execute_query(_VERIFICATION_BUNDLE_QUERY, {"email": self.test_email})[0]
+
+        if row[0] is not None:
+            self._user_cache = {
+                "id": row[0],
+                "email": row[1],
+                "totp_secret": row[2],
+                "is_deleted": row[3],
+                "created_at": row[4]
+            }
+        if row[5] is None:
+            return {"error": "Workspace not found"}
+
+        self._workspace_cache = {
+            "id": row[5],
+            "ulid": row[6],
+            "status": row[7],
+            "email": row[8],
+            "first_name": row[9],
+            "last_name": row[10],
+            "created_at": row[11],
+            "is_deleted": row[12]
+        }
+        snapshot = None
+        if row[16] is not None:
+            snapshot = self._snapshot_cache[row[5]] = {
+                "id": row[16], "status": row[17], "created_at": row[18]
+            }
+
+        return {
+            "categories_count": row[13],
+            "prompts_count": row[14],
+            "competitors_count": row[15],
+            "snapshot": snapshot,
+            "snapshot_prompts_status": row[19] if snapshot else None
+        }
+
+    def full_verification(
+        self,
+        workspace: Optional[dict] = None,
+        snapshot: Optional[dict] = None,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Perform full verification of all canary test data.
 
+        Args:
+            workspace: Workspace row already fetched in a final state, reused
+                for the status check instead of re-reading it
+            snapshot: Latest snapshot row already fetched in a final state,
+                reused by the snapshot checks instead of re-reading it
+            data: Result of get_comprehensive_data_batched; its counts and
+                snapshot are used instead of querying them again. Without
+                it, they are loaded with one _fetch_verification_bundle()
+
         Returns a comprehensive report of all verification results.
         """
-        workspace = self.get_workspace()
+        final_workspace = workspace
+        if not data or "error" in data:
+            data = self._fetch_verification_bundle()
+            # The bundle just re-read the workspace row
+            final_workspace = final_workspace or self._workspace_cache
+        report = data if "error" not in data else {}
+
+        workspace = workspace or self.get_workspace()
         workspace_id = workspace["id"] if workspace else None
 
+        # The checks below run serially on purpose: with the inputs above
+        # prefetched they read cached rows (at most the user row is queried),
+        # so a thread pool would only add dispatch overhead and pull queries
+        # off the connection held by `with verifier:`
         results = {
             "user": self.verify_user_exists(),
             "workspace": self.verify_workspace_created(),
@@ -630,13 +1335,17 @@ class DBVerifier:
         }
 
         if workspace:
-            results["workspace_status"] = self.verify_workspace_status("COMPLETED")
-            results["categories"] = self.verify_categories_created()
-            results["prompts"] = self.verify_prompts_created()
-            results["snapshot"] = self.verify_snapshot_created()
-            results["snapshot_completed"] = self.verify_snapshot_completed()
-            results["all_prompts_completed"] = self.verify_all_prompts_completed()
-            results["competitors"] = self.verify_competitors_found()
+            if snapshot is None:
+                snapshot = report["snapshot"] if report else self.get_latest_snapshot(workspace_id)
+            results["workspace_status"] = self.verify_workspace_status("COMPLETED", final_workspace)
+            results["categories"] = self.verify_categories_created(count=report.get("categories_count"))
+            results["prompts"] = self.verify_prompts_created(count=report.get("prompts_count"))
+            results["snapshot"] = self.verify_snapshot_created(snapshot)
+            results["snapshot_completed"] = self.verify_snapshot_completed(snapshot)
+            results["all_prompts_completed"] = self.verify_all_prompts_completed(
+                snapshot, report.get("snapshot_prompts_status")
+            )
+            results["competitors"] = self.verify_competitors_found(count=report.get("competitors_count"))
 
         # Build summary
         all_passed = all(
@@ -675,32 +1384,36 @@ class DBVerifier:
 
         workspace = self.get_workspace()
         user = self.get_user()
+        self._decrypted_secret = self._totp = self._otp_token = None
+
+        delete_workspace = bool(workspace) and not workspace.get("is_deleted")
+        delete_user = bool(user) and not user.get("is_deleted")
 
         try:
-            with self.engine.connect() as conn:
-                # Soft delete workspace
-                if workspace and not workspace.get("is_deleted"):
+            # Both soft deletes share one transaction and one commit
+            with self.engine.begin() as conn:
+                if delete_workspace:
                     query = """
                         UPDATE workspaces
                         SET is_deleted = true, deleted_at = NOW()
                         WHERE id = :workspace_id AND NOT is_deleted
                     """
                     conn.execute(text(query), {"workspace_id": workspace["id"]})
-                    conn.commit()
-                    results["workspace_deleted"] = True
-                    logger.info(f"Soft deleted workspace {workspace['id']} (ULID: {workspace['ulid']})")
 
-                # Soft delete user
-                if user and not user.get("is_deleted"):
+                if delete_user:
                     query = """
                         UPDATE users
                         SET is_deleted = true, deleted_at = NOW()
                         WHERE id = :user_id AND NOT is_deleted
                     """
                     conn.execute(text(query), {"user_id": user["id"]})
-                    conn.commit()
-                    results["user_deleted"] = True
-                    logger.info(f"Soft deleted user {user['id']} ({user['email']})")
+
+            if delete_workspace:
+                results["workspace_deleted"] = True
+                logger.info("Soft deleted workspace %s (ULID: %s)", workspace["id"], workspace["ulid"])
+            if delete_user:
+                results["user_deleted"] = True
+                logger.info("Soft deleted user %s (%s)", user["id"], user["email"])
 
         except Exception as e:
             error_msg = f"Cleanup error: {e}"
@@ -710,5 +1423,12 @@ class DBVerifier:
         return results
 
     def close(self):
-        """Close the database connection."""
-        self.engine.dispose()
+        """Release this verifier.
+
+        The engine is shared and stays open for the next run; see
+        dispose_shared_engine() for process shutdown.
+        """
+        self._user_cache = self._workspace_cache = None
+        self._decrypted_secret = self._totp = self._otp_token = None
+        self._snapshot_cache.clear()
+        self._prompts_status_cache.clear()
@@ -6,32 +6,94 @@ This ensures the canary module can run independently.
 """
 
 import os
+import asyncio
+import base64
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+import time
+from typing import Any, Awaitable, Coroutine, Iterator, Mapping, Optional, Tuple, TypeVar, Union
 import pyotp
 from cryptography.fernet import Fernet
 
 
+T = TypeVar("T")
+
 # TOTP validity period - must match app/shared/utils/totp.py
 VALIDITY_PERIOD = 15 * 60  # 15 minutes in seconds
 
 
+# Shared by every canary logger's handler
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s [%(levelname)s] %(name)s | %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
 def get_canary_logger(name: str) -> logging.Logger:
-    """Get a simple logger for canary tests."""
+    """Get a simple logger for canary tests.
+
+    Records go to its own handler only; they don't also propagate to root.
+    """
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            '%(asctime)s [%(levelname)s] %(name)s | %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_LOG_FORMATTER)
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)
+        logger.propagate = False
     return logger
 
 
+def run_on_fast_loop(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on a uvloop event loop when available.
+
+    Like asyncio.run(), and falls back to it without uvloop. The loop is
+    created for this call only; the process-wide event loop policy is left
+    alone. Opt-out with CANARY_DISABLE_UVLOOP=true to compare against stock
+    asyncio.
+    """
+    if os.getenv("CANARY_DISABLE_UVLOOP", "false").lower() != "true":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
+
+async def first_completed(waiters: Mapping[str, Awaitable[Any]]) -> Tuple[Optional[str], Any]:
+    """Race named awaitables; return (name, result) of the first to succeed.
+
+    Waiters that fail (e.g. time out) are skipped; the rest are cancelled as
+    soon as one succeeds. Returns (None, None) if all of them fail.
+    """
+    tasks = {asyncio.ensure_future(waiter): name for name, waiter in waiters.items()}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return tasks[task], task.result()
+        return None, None
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def poll_delays(cap: float, start: float = 0.1, factor: float = 1.5) -> Iterator[float]:
+    """Yield capped exponentially growing delays for a polling loop.
+
+    Fast transitions are seen within ~100ms while slow ones settle at one
+    query per `cap` seconds.
+    """
+    delay = start
+    while True:
+        yield delay
+        delay = min(delay * factor, cap)
+
+
 def decrypt_string(encrypted_value: str) -> str:
     """
     Decrypt a Fernet-encrypted string.
@@ -42,51 +104,51 @@ def decrypt_string(encrypted_value: str) -> str:
     NOTE: The encryption in app/shared/utils/encryption.py does an extra base64 encode
     after Fernet encryption, so we need to base64 decode first before Fernet decryption.
     """
-    import base64
-
     encryption_key = os.getenv("FERNET_ENCRYPTION_KEY")
     if not encryption_key:
         raise ValueError("FERNET_ENCRYPTION_KEY not found in environment variables")
 
-    fernet = Fernet(encryption_key.encode() if isinstance(encryption_key, str) else encryption_key)
-
     # First base64 decode (to undo the extra encoding done during encryption)
     encrypted_bytes = base64.urlsafe_b64decode(encrypted_value.encode())
 
     # Then Fernet decrypt
-    decrypted = fernet.decrypt(encrypted_bytes)
+    decrypted = Fernet(encryption_key.encode()).decrypt(encrypted_bytes)
     return decrypted.decode()
 
 
-def _get_start_time() -> int:
+def totp_window_start() -> int:
     """Get the start time for TOTP calculation.
 
     The app uses 15-minute windows, rounded down to the start of the window.
     This must match app/shared/utils/totp.py._get_start_time()
     """
-    current_time = int(datetime.now(timezone.utc).timestamp())
-    return int(current_time - (current_time % VALIDITY_PERIOD))
+    current_time = int(time.time())
+    return current_time - current_time % VALIDITY_PERIOD
 
 
-def generate_totp_token(secret: str) -> str:
-    """Generate a TOTP token from a secret.
+def generate_totp_token(secret: Union[str, pyotp.TOTP], window_start: Optional[int] = None) -> str:
+    """Generate a TOTP token from a secret (or a TOTP already built from it).
 
     IMPORTANT: Uses 15-minute windows to match app/shared/utils/totp.py
+    window_start defaults to the current window (see totp_window_start).
     """
-    totp = pyotp.TOTP(secret)
-    return totp.at(_get_start_time())
+    if window_start is None:
+        window_start = totp_window_start()
+    totp = secret if isinstance(secret, pyotp.TOTP) else pyotp.TOTP(secret)
+    return totp.at(window_start)
 
 
 def get_database_url() -> str:
     """Get database connection URL from settings or environment."""
-    # Try to load from app settings first
+    # Try to load from app settings first (absent when running standalone)
     try:
-        # from app.shared.config import get_settings
-        settings = get_settings()
-        if settings.DATABASE_URL:
-            return settings.DATABASE_URL
-    except Exception:
+        from app.shared.config import get_settings
+    except ImportError:
         pass
+    else:
+        database_url = getattr(get_settings(), "DATABASE_URL", None)
+        if database_url:
+            return database_url
 
     # Fall back to environment variables
     db_user = os.getenv("POSTGRES_USER", "maxeo")
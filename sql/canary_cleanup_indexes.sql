@@ -0,0 +1,20 @@
+-- Partial indexes for the canary cleanup scans
+--
+-- CanaryCleanup filters canary rows with
+--   lower(email) LIKE '%@canary.maxeo.ai' [AND created_at < :cutoff] AND NOT is_deleted
+-- A leading-wildcard LIKE can't use a B-tree on email, so index created_at
+-- over just the live canary rows instead; that also serves the ORDER BY
+-- created_at of get_canary_workspaces() / get_canary_users(). The predicate
+-- must match CanaryConfig.EMAIL_DOMAIN (lowercased) literally for the planner
+-- to pick these up.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply with psql
+-- (autocommit), not from a migration transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_workspaces_canary_cleanup
+    ON workspaces (created_at)
+    WHERE lower(email) LIKE '%@canary.maxeo.ai' AND NOT is_deleted;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_users_canary_cleanup
+    ON users (created_at)
+    WHERE lower(email) LIKE '%@canary.maxeo.ai' AND NOT is_deleted;
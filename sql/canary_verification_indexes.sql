@@ -0,0 +1,24 @@
+-- Indexes for the DBVerifier lookups the canary runs on every poll
+--
+-- The user and workspace rows are found with
+--   lower(email) = lower(:email) AND NOT is_deleted [ORDER BY created_at DESC]
+-- which the expression indexes below serve directly (ILIKE, even without
+-- wildcards, cannot use a B-tree). Snapshots are read newest-first per
+-- workspace, and snapshot prompts are counted per snapshot and status.
+--
+-- CONCURRENTLY cannot run inside a transaction block; apply with psql
+-- (autocommit), not from a migration transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_active
+    ON users (lower(email))
+    WHERE NOT is_deleted;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workspaces_email_active
+    ON workspaces (lower(email), created_at DESC)
+    WHERE NOT is_deleted;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_snapshots_ws_created
+    ON snapshots (workspace_id, created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_snapshot_prompts_snap_status
+    ON snapshot_prompts (snapshot_id, status);
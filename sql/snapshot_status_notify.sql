@@ -0,0 +1,20 @@
+-- Snapshot status notifications for the canary test
+--
+-- Publishes '<workspace_id>:<status>' on the snapshot_status channel whenever
+-- a snapshot is created or its status changes, so
+-- DBVerifier.wait_for_snapshot_status() can wake up on the transition instead
+-- of polling. Safe to re-run.
+
+CREATE OR REPLACE FUNCTION notify_snapshot_status() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('snapshot_status', NEW.workspace_id::text || ':' || NEW.status::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS snapshot_status_notify ON snapshots;
+
+CREATE TRIGGER snapshot_status_notify
+    AFTER INSERT OR UPDATE OF status ON snapshots
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_snapshot_status();
@@ -0,0 +1,20 @@
+-- Workspace status notifications for the canary test
+--
+-- Publishes '<ulid>:<status>' on the workspace_status channel whenever a
+-- workspace's status changes, so DBVerifier.wait_for_status() can wake up on
+-- the transition instead of polling. Safe to re-run.
+
+CREATE OR REPLACE FUNCTION notify_workspace_status() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('workspace_status', NEW.ulid || ':' || NEW.status::text);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS workspace_status_notify ON workspaces;
+
+CREATE TRIGGER workspace_status_notify
+    AFTER UPDATE OF status ON workspaces
+    FOR EACH ROW
+    WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION notify_workspace_status();